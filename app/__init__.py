@@ -4,7 +4,10 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_babel import Babel
 from flask_migrate import Migrate
 from flask_wtf.csrf import CSRFProtect
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import event
 import os
+import sqlite3
 import sys
 
 db = SQLAlchemy()
@@ -15,6 +18,13 @@ csrf = CSRFProtect()
 def get_locale():
     return request.accept_languages.best_match(['es', 'en'], default='es')
 
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """SQLite ignores ON DELETE CASCADE unless foreign keys are switched on per connection."""
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 def create_app(config_class=None):
     """Create and configure the Flask application."""
     print("Creating Flask app...")
@@ -61,10 +71,22 @@ def create_app(config_class=None):
     
     # Initialize extensions
     db.init_app(app)
+    
+    # Only this app's own engine; other SQLite engines in the process are left alone
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, "connect", _enable_sqlite_foreign_keys)
+    
     babel.init_app(app, locale_selector=get_locale)
     migrate.init_app(app, db)
     csrf.init_app(app)
     
+    # Persist compiled templates so new workers skip re-compiling them (optional)
+    bytecode_cache_dir = app.config.get('JINJA_BYTECODE_CACHE_DIR')
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+    
     # Configure logging
     from app.logging_config import configure_logging
     configure_logging(app)
@@ -1,12 +1,17 @@
 # app/admin_auth.py
 """
 Admin authentication module.
-Handles password verification for admin panel access.
+Handles password verification and the signed admin cookie.
 """
 
 import os
+from itsdangerous import URLSafeTimedSerializer, BadSignature
 from werkzeug.security import check_password_hash, generate_password_hash
-from flask import current_app
+from flask import current_app, request
+from app.constants import Security, TimeLimit
+
+# Salt separating admin tokens from anything else signed with SECRET_KEY
+ADMIN_TOKEN_SALT = 'admin-auth'
 
 # Cache for the hashed password to avoid re-hashing on every check
 _password_hash_cache = None
@@ -61,6 +66,47 @@ def verify_admin_password(password):
         current_app.logger.error(f"Error verifying admin password: {str(e)}")
         return False
 
+def _get_token_serializer():
+    """Build the serializer used to sign the admin cookie."""
+    return URLSafeTimedSerializer(current_app.config['SECRET_KEY'], salt=ADMIN_TOKEN_SALT)
+
+def generate_admin_token():
+    """
+    Create a signed, timestamped token for the admin cookie.
+    
+    Returns:
+        str: Token to store in the admin cookie
+    """
+    return _get_token_serializer().dumps({'admin': True})
+
+def is_admin_authenticated():
+    """
+    Check the admin cookie on the current request.
+    
+    The signature is verified once per request and the result kept on the
+    request object for any later checks. (Not ``flask.g``: an app context
+    can outlive a single request, e.g. under the test client.)
+    
+    Returns:
+        bool: True if the cookie holds a valid, unexpired admin token
+    """
+    cached = getattr(request, '_admin_ok', None)
+    if cached is not None:
+        return cached
+    
+    authenticated = False
+    token = request.cookies.get(Security.ADMIN_COOKIE_NAME)
+    if token:
+        try:
+            data = _get_token_serializer().loads(token, max_age=TimeLimit.ADMIN_SESSION_TIMEOUT)
+            authenticated = isinstance(data, dict) and data.get('admin') is True
+        except BadSignature:
+            # Also covers SignatureExpired
+            authenticated = False
+    
+    request._admin_ok = authenticated
+    return authenticated
+
 def reset_password_cache():
     """
     Reset the password hash cache.
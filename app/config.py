@@ -5,7 +5,7 @@ from datetime import timedelta
 from pathlib import Path
 from dotenv import load_dotenv
 from app.constants import (
-    Language, DEFAULT_CONFIG)
+    Language, TimeLimit, DEFAULT_CONFIG)
 
 basedir = Path(__file__).parent.parent.absolute()
 load_dotenv(basedir / '.env')
@@ -162,6 +162,22 @@ class Config:
     WTF_CSRF_ENABLED = True
     WTF_CSRF_TIME_LIMIT = None  # No time limit for CSRF tokens
     
+    # Worker threads used to build the export-all report bundle in parallel
+    EXPORT_MAX_WORKERS = int(get_env_variable('EXPORT_MAX_WORKERS', '3'))
+    
+    # Concurrent WhatsApp sends in bulk link/reminder jobs; the overall rate is
+    # still capped by WHATSAPP_MIN_SEND_INTERVAL
+    BULK_SEND_MAX_WORKERS = int(get_env_variable('BULK_SEND_MAX_WORKERS', '8'))
+    
+    # Directory for Jinja's compiled-template cache (unset disables it)
+    JINJA_BYTECODE_CACHE_DIR = get_env_variable('JINJA_BYTECODE_CACHE_DIR')
+    
+    # Seconds to cache admin dashboard statistics (0 disables the cache)
+    STATS_CACHE_TIMEOUT = int(get_env_variable(
+        'STATS_CACHE_TIMEOUT',
+        str(TimeLimit.STATS_CACHE_TIMEOUT)
+    ))
+    
     # ============================================
     # OPTIONAL EXTERNAL SERVICES
     # ============================================
@@ -265,6 +281,12 @@ class TestConfig(Config):
     ADMIN_PASSWORD = 'test-password'
     ADMIN_EMAIL = 'test@test.com'
     ADMIN_PHONE = '555-TEST'
+    # In-memory SQLite shares one connection across threads; build reports serially
+    EXPORT_MAX_WORKERS = 1
+    # Tests write straight to the DB and expect fresh statistics
+    STATS_CACHE_TIMEOUT = 0
+    # ...and fresh allergen lists
+    ALLERGEN_CACHE_TIMEOUT = 0
     
     # Use defaults for other values
     WEDDING_DATE = DEFAULT_CONFIG['WEDDING_DATE']
@@ -47,6 +47,10 @@ class TimeLimit:
     
     # Cache durations (in seconds)
     CACHE_TIMEOUT = 3600  # 1 hour
+    STATS_CACHE_TIMEOUT = 60  # Admin dashboard aggregates
+    AIRTABLE_CACHE_TIMEOUT = 300  # Airtable is remote and rate-limited
+    HEALTH_CHECK_CACHE_TIMEOUT = 5  # Load balancer probes share one DB ping
+    ALLERGEN_CACHE_TIMEOUT = 300  # RSVP form checkbox list, effectively static
     
     # Auto-dismiss flash messages (in milliseconds)
     FLASH_MESSAGE_TIMEOUT = 5000  # 5 seconds
@@ -173,6 +177,7 @@ class FileUpload:
     ALLOWED_EXTENSIONS = ['csv']
     MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
     CSV_ENCODING = 'utf-8-sig'
+    IMPORT_CHUNK_SIZE = 1000  # Rows per multi-row INSERT during CSV import
 
 
 class Security:
@@ -6,8 +6,11 @@ class Allergen(db.Model):
     name = db.Column(db.String(50), unique=True, nullable=False)
 
 class GuestAllergen(db.Model):
+    # Leading rsvp_id also covers loading and cascading an RSVP's allergens
+    __table_args__ = (db.Index('ix_guest_allergen_rsvp_guest', 'rsvp_id', 'guest_name'),)
+    
     id = db.Column(db.Integer, primary_key=True)
-    rsvp_id = db.Column(db.Integer, db.ForeignKey('rsvp.id'), nullable=False)
+    rsvp_id = db.Column(db.Integer, db.ForeignKey('rsvp.id', ondelete='CASCADE'), nullable=False)
     guest_name = db.Column(db.String(120), nullable=False)  # Name of the person with the allergy
     allergen_id = db.Column(db.Integer, db.ForeignKey('allergen.id'))
     custom_allergen = db.Column(db.String(100))  # For non-standard allergens
@@ -6,7 +6,7 @@ class Guest(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(120), nullable=False)
     surname = db.Column(db.String(120), nullable=True)
-    phone = db.Column(db.String(20))
+    phone = db.Column(db.String(20), index=True)
     token = db.Column(db.String(100), unique=True, nullable=False)
     language_preference = db.Column(db.String(2), default='en')
     personal_message = db.Column(db.Text, nullable=True)
@@ -3,7 +3,8 @@ from datetime import datetime, timedelta, date, timezone
 from app import db
 from flask import current_app
 from app.models.allergen import GuestAllergen
-from app.constants import TimeLimit, DEFAULT_CONFIG, DateFormat
+from app.constants import TimeLimit, DEFAULT_CONFIG
+from app.utils.dates import parse_config_date
 
 
 def _utc_now():
@@ -12,8 +13,14 @@ def _utc_now():
 
 
 class RSVP(db.Model):
+    # Attending/cancelled filter used by the statistics, reports and PDFs
+    __table_args__ = (
+        db.Index('ix_rsvp_attending_cancelled', 'is_attending', 'is_cancelled'),
+    )
+    
     id = db.Column(db.Integer, primary_key=True)
-    guest_id = db.Column(db.Integer, db.ForeignKey('guest.id', ondelete='CASCADE'), nullable=False)
+    guest_id = db.Column(db.Integer, db.ForeignKey('guest.id', ondelete='CASCADE'), nullable=False,
+                         index=True)  # Looked up on every RSVP page
     is_attending = db.Column(db.Boolean, default=False)
     is_cancelled = db.Column(db.Boolean, default=False)
     preboda_attending = db.Column(db.Boolean, nullable=True, default=None)
@@ -27,8 +34,12 @@ class RSVP(db.Model):
     cancellation_date = db.Column(db.DateTime)
     
     guest = db.relationship('Guest', back_populates='rsvp')
-    additional_guests = db.relationship('AdditionalGuest', back_populates='rsvp', cascade='all, delete-orphan')
-    allergens = db.relationship('GuestAllergen', backref='rsvp', lazy='joined', cascade='all, delete-orphan')
+    # The database cascades RSVP deletes (ondelete='CASCADE'), so unloaded
+    # children are not fetched just to be deleted one by one
+    additional_guests = db.relationship('AdditionalGuest', back_populates='rsvp', cascade='all, delete-orphan',
+                                        passive_deletes=True)
+    allergens = db.relationship('GuestAllergen', backref='rsvp', lazy='joined', cascade='all, delete-orphan',
+                                passive_deletes=True)
 
     @property
     def is_editable(self):
@@ -56,7 +67,7 @@ class RSVP(db.Model):
         rsvp_deadline_str = current_app.config.get('RSVP_DEADLINE', DEFAULT_CONFIG['RSVP_DEADLINE']) if current_app else None
         if rsvp_deadline_str:
             try:
-                rsvp_deadline = datetime.strptime(rsvp_deadline_str, DateFormat.DATABASE).date()
+                rsvp_deadline = parse_config_date(rsvp_deadline_str)
                 if date.today() > rsvp_deadline:
                     return False  # RSVP deadline has passed
             except (ValueError, TypeError):
@@ -64,24 +75,48 @@ class RSVP(db.Model):
                 pass
         
         # Then check if it's still editable based on wedding date
+        cutoff_date = RSVP._wedding_cutoff()
+        if cutoff_date is None:
+            return True  # Default to editable if no app context or wedding date
+        
+        # Compare with naive datetime for wedding date (it's a date, not a moment)
+        return datetime.now() < cutoff_date
+
+    @staticmethod
+    def _wedding_cutoff():
+        """
+        Return the naive datetime after which RSVPs stop being editable, or
+        None if there is no app context or the wedding date config is unusable.
+        """
         try:
             # Get the wedding date from the config
             if not current_app:
-                return True  # Default to editable if no app context
+                return None
                 
             wedding_date_str = current_app.config.get('WEDDING_DATE', DEFAULT_CONFIG['WEDDING_DATE'])
             if not wedding_date_str:
-                return True  # Default to editable if no wedding date is set
+                return None
                 
-            wedding_date = datetime.strptime(wedding_date_str, DateFormat.DATABASE)
+            wedding_date = datetime.combine(parse_config_date(wedding_date_str), datetime.min.time())
             cutoff_days = current_app.config.get('WARNING_CUTOFF_DAYS', DEFAULT_CONFIG['WARNING_CUTOFF_DAYS'])
-            cutoff_date = wedding_date - timedelta(days=cutoff_days)
-            
-            # Compare with naive datetime for wedding date (it's a date, not a moment)
-            return datetime.now() < cutoff_date
+            return wedding_date - timedelta(days=cutoff_days)
         except (ValueError, KeyError, TypeError):
-            # In case of config issue or testing environment, default to True for safety
-            return True
+            # In case of config issue or testing environment, default to editable for safety
+            return None
+
+    @classmethod
+    def editable_before_deadline_clause(cls):
+        """
+        SQL version of is_editable for callers that have already checked the
+        RSVP deadline: created within the edit window, or still before the
+        wedding cutoff.
+        """
+        cutoff_date = cls._wedding_cutoff()
+        if cutoff_date is None or datetime.now() < cutoff_date:
+            return db.true()
+        # created_at is stored as naive UTC
+        edit_window_start = _utc_now().replace(tzinfo=None) - timedelta(hours=TimeLimit.RSVP_EDIT_HOURS)
+        return cls.created_at > edit_window_start
 
     @property
     def allergen_ids(self):
@@ -117,7 +152,7 @@ class RSVP(db.Model):
 class AdditionalGuest(db.Model):
     """Model for additional guests (family members or plus ones)."""
     id = db.Column(db.Integer, primary_key=True)
-    rsvp_id = db.Column(db.Integer, db.ForeignKey('rsvp.id', ondelete='CASCADE'), nullable=False)
+    rsvp_id = db.Column(db.Integer, db.ForeignKey('rsvp.id', ondelete='CASCADE'), nullable=False, index=True)
     name = db.Column(db.String(120), nullable=False)
     is_child = db.Column(db.Boolean, default=False)
     needs_menu = db.Column(db.Boolean, default=False)  # For children: whether they need a meal
@@ -1,27 +1,49 @@
 # app/routes/admin.py - REFACTORED VERSION
-from flask import Blueprint, render_template, request, flash, redirect, url_for, Response, current_app
+from flask import (
+    Blueprint, render_template, request, flash, redirect, url_for, Response, current_app, send_file
+)
 from app.services.admin_service import AdminService
 from app.services.guest_service import GuestService
 from app.services.rsvp_service import RSVPService
+from app.services.pdf_service import PDFService
 from app.forms import LoginForm, GuestForm, ImportForm
 from app.security import rate_limit
+from app.admin_auth import generate_admin_token, is_admin_authenticated
 from app.constants import (
     LogMessage, ErrorMessage, FlashCategory, TimeLimit, Template, Security
 )
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from functools import wraps
+import csv
+import hashlib
+import io
 import logging
+import tempfile
+import zipfile
 
 logger = logging.getLogger(__name__)
 
 bp = Blueprint('admin', __name__, url_prefix='/admin')
 
+# PDFs larger than this spill from memory to a temp file while being served
+PDF_SPOOL_MAX_SIZE = 5 * 1024 * 1024
+
+# Fastest deflate level for the export bundle: the PDFs are already
+# compressed, so higher levels cost CPU for almost no size gain
+EXPORT_ZIP_COMPRESSLEVEL = 1
+
+# The guest import template is static, so build it and its ETag once
+_CSV_TEMPLATE_BYTES = AdminService.generate_csv_template().encode('utf-8')
+_CSV_TEMPLATE_ETAG = hashlib.sha1(_CSV_TEMPLATE_BYTES).hexdigest()
+CSV_TEMPLATE_MAX_AGE = 86400  # 1 day
+
 
 def admin_required(f):
     """Decorator to require admin authentication."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not request.cookies.get(Security.ADMIN_COOKIE_NAME):
+        if not is_admin_authenticated():
             logger.warning(LogMessage.ADMIN_UNAUTHORIZED.format(ip=request.remote_addr))
             return redirect(url_for('admin.login'))
         return f(*args, **kwargs)
@@ -42,7 +64,7 @@ def login():
             response = redirect(url_for('admin.dashboard'))
             response.set_cookie(
                 Security.ADMIN_COOKIE_NAME,
-                'true',
+                generate_admin_token(),
                 httponly=Security.COOKIE_HTTPONLY,
                 secure=current_app.config.get('SESSION_COOKIE_SECURE', True),
                 max_age=TimeLimit.ADMIN_SESSION_TIMEOUT
@@ -106,11 +128,10 @@ def import_guests():
     
     if form.validate_on_submit():
         try:
-            # Use service to import guests
-            file_content = form.file.data.read()
-            guests = GuestService.import_guests_from_csv(file_content)
+            # Stream the upload through the service instead of reading it whole
+            count = GuestService.import_guests_from_stream(form.file.data.stream)
             
-            flash(f'Successfully imported {len(guests)} guests', 'success')
+            flash(f'Successfully imported {count} guests', 'success')
             
         except Exception as e:
             logger.error(f"Error importing guests: {str(e)}")
@@ -128,13 +149,17 @@ def import_guests():
 @admin_required
 def download_template():
     """Download CSV template for guest import."""
-    template_content = AdminService.generate_csv_template()
-    
-    return Response(
-        template_content,
+    response = Response(
+        _CSV_TEMPLATE_BYTES,
         mimetype='text/csv',
         headers={'Content-Disposition': 'attachment;filename=guest_template.csv'}
     )
+    response.set_etag(_CSV_TEMPLATE_ETAG)
+    response.cache_control.private = True
+    response.cache_control.max_age = CSV_TEMPLATE_MAX_AGE
+    
+    # Answers If-None-Match with a 304 and no body
+    return response.make_conditional(request)
 
 
 @bp.route('/logout')
@@ -142,7 +167,7 @@ def logout():
     """Log out admin user."""
     logger.info(f"Admin logout: {request.remote_addr}")
     response = redirect(url_for('admin.login'))
-    response.delete_cookie('admin_authenticated')
+    response.delete_cookie(Security.ADMIN_COOKIE_NAME)
     return response
 
 
@@ -191,10 +216,6 @@ def export_report():
 def download_dietary_docx():
     """Download the catering dietary-restrictions report as a Word document."""
     try:
-        from app.services.pdf_service import PDFService
-        from flask import send_file
-        import io
-
         logger.info("Admin requested dietary DOCX download")
 
         docx_data = PDFService.generate_dietary_docx()
@@ -216,34 +237,37 @@ def download_dietary_docx():
         flash(f"Error generating document: {str(e)}", 'error')
         return redirect(url_for('admin.dietary_report'))
 
+def _send_pdf(generate, filename):
+    """
+    Build a PDF into a spooled temp file and stream it to the client.
+
+    ReportLab writes straight into the spool, so the document is never held
+    twice in memory; send_file then serves it in chunks and closes the file.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE)
+    try:
+        generate(spool)
+        spool.seek(0)
+    except Exception:
+        spool.close()
+        raise
+
+    return send_file(
+        spool,
+        mimetype='application/pdf',
+        as_attachment=True,
+        download_name=filename
+    )
+
 @bp.route('/reports/transport/pdf')
 @admin_required
 def download_transport_pdf():
     """Download transport requirements report as PDF."""
     try:
-        from app.services.pdf_service import PDFService
-        from flask import send_file
-        import io
-        
         logger.info("Admin requested transport PDF download")
-        
-        # Generate PDF
-        pdf_data = PDFService.generate_transport_pdf()
-        
-        # Create a file-like object
-        pdf_buffer = io.BytesIO(pdf_data)
-        pdf_buffer.seek(0)
-        
-        # Generate filename with date
+
         filename = f"transport_plan_{datetime.now().strftime('%Y%m%d')}.pdf"
-        
-        # Send file
-        return send_file(
-            pdf_buffer,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=filename
-        )
+        return _send_pdf(PDFService.generate_transport_pdf, filename)
         
     except Exception as e:
         logger.error(f"Error generating transport PDF: {str(e)}", exc_info=True)
@@ -255,29 +279,10 @@ def download_transport_pdf():
 def download_preboda_pdf():
     """Download pre-boda attendance report as PDF."""
     try:
-        from app.services.pdf_service import PDFService
-        from flask import send_file
-        import io
-        
         logger.info("Admin requested pre-boda PDF download")
-        
-        # Generate PDF
-        pdf_data = PDFService.generate_preboda_pdf()
-        
-        # Create a file-like object
-        pdf_buffer = io.BytesIO(pdf_data)
-        pdf_buffer.seek(0)
-        
-        # Generate filename with date
+
         filename = f"preboda_attendance_{datetime.now().strftime('%Y%m%d')}.pdf"
-        
-        # Send file
-        return send_file(
-            pdf_buffer,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=filename
-        )
+        return _send_pdf(PDFService.generate_preboda_pdf, filename)
         
     except Exception as e:
         logger.error(f"Error generating pre-boda PDF: {str(e)}", exc_info=True)
@@ -290,37 +295,58 @@ def download_preboda_pdf():
 def export_all_reports():
     """Generate and download all reports as a ZIP file."""
     try:
-        from app.services.pdf_service import PDFService
-        from flask import send_file
-        import io
-        import zipfile
-        
         logger.info("Admin requested full report export")
         
+        app = current_app._get_current_object()
+        
+        def _run_in_app_context(generate):
+            # A fresh app context gives each worker its own SQLAlchemy session
+            with app.app_context():
+                return generate()
+        
+        # One eager-loaded scan of the RSVPs feeds the guest list, transport
+        # plan and children menus; the dietary report aggregates allergens itself
+        rsvps = AdminService.get_export_rsvps()
+        attending_rsvps = [r for r in rsvps if r.is_attending and not r.is_cancelled]
+        report = AdminService.get_detailed_rsvp_report(rsvps)
+        transport_data = AdminService.get_transport_report(attending_rsvps)
+        children_menu_data = PDFService.get_children_menu_data(attending_rsvps)
+        dietary_data = AdminService.get_dietary_report()
+        
+        # Rendering only reads the data gathered above, so run it concurrently
+        with ThreadPoolExecutor(max_workers=app.config.get('EXPORT_MAX_WORKERS', 3)) as executor:
+            dietary_future = executor.submit(
+                _run_in_app_context,
+                lambda: PDFService.generate_dietary_pdf(
+                    dietary_data=dietary_data, children_menu_data=children_menu_data
+                )
+            )
+            transport_future = executor.submit(
+                _run_in_app_context,
+                lambda: PDFService.generate_transport_pdf(transport_data=transport_data)
+            )
+        csv_rows = _iter_guest_csv_rows(report)
+        
         # Create ZIP buffer
         zip_buffer = io.BytesIO()
+        date_str = datetime.now().strftime('%Y%m%d')
         
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        with zipfile.ZipFile(
+            zip_buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=EXPORT_ZIP_COMPRESSLEVEL
+        ) as zip_file:
             # Add dietary PDF
-            dietary_pdf = PDFService.generate_dietary_pdf()
-            zip_file.writestr(
-                f"dietary_restrictions_{datetime.now().strftime('%Y%m%d')}.pdf",
-                dietary_pdf
-            )
+            zip_file.writestr(f"dietary_restrictions_{date_str}.pdf", dietary_future.result())
             
             # Add transport PDF
-            transport_pdf = PDFService.generate_transport_pdf()
-            zip_file.writestr(
-                f"transport_plan_{datetime.now().strftime('%Y%m%d')}.pdf",
-                transport_pdf
-            )
+            zip_file.writestr(f"transport_plan_{date_str}.pdf", transport_future.result())
             
-            # Add CSV export of all guests
-            csv_data = _generate_guest_csv()
-            zip_file.writestr(
-                f"guest_list_{datetime.now().strftime('%Y%m%d')}.csv",
-                csv_data
-            )
+            # Add CSV export of all guests, written row by row into the entry
+            with io.TextIOWrapper(
+                zip_file.open(f"guest_list_{date_str}.csv", 'w'), encoding='utf-8', newline=''
+            ) as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow(GUEST_CSV_HEADER)
+                writer.writerows(csv_rows)
         
         # Prepare for download
         zip_buffer.seek(0)
@@ -340,21 +366,8 @@ def export_all_reports():
         return redirect(url_for('admin.dashboard'))
 
 
-def _generate_guest_csv():
-    """
-    Helper function to generate CSV export of all guests and RSVPs.
-    
-    Returns:
-        CSV data as string
-    """
-    import csv
-    import io
-    
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Header
-    writer.writerow([
+# Column headings for the guest list CSV export
+GUEST_CSV_HEADER = [
     'Guest Name',
     'Phone',
     'Language',
@@ -367,11 +380,25 @@ def _generate_guest_csv():
     'Transport to Hotel',
     'Dietary Restrictions',
     'Last Updated'
-])
+]
+
+
+def _iter_guest_csv_rows(report=None):
+    """
+    Yield the guest list CSV export one row at a time.
+    
+    Rows match GUEST_CSV_HEADER, so callers can hand them straight to a
+    csv.writer on whatever stream they are writing to.
     
+    Args:
+        report: Precomputed AdminService.get_detailed_rsvp_report() (optional)
+    
+    Yields:
+        List of cell values for one RSVP
+    """
     # Get all RSVPs with detailed info
-    from app.services.admin_service import AdminService
-    report = AdminService.get_detailed_rsvp_report()
+    if report is None:
+        report = AdminService.get_detailed_rsvp_report()
     
     for rsvp_data in report:
         # Format allergens
@@ -399,7 +426,7 @@ def _generate_guest_csv():
             ]
             additional_str = ', '.join(additional_list)
         
-        writer.writerow([
+        yield [
             rsvp_data['guest_name'],
             rsvp_data['guest_phone'],
             rsvp_data['language'],
@@ -412,6 +439,4 @@ def _generate_guest_csv():
             'Yes' if rsvp_data['transport_hotel'] else 'No',
             allergens_str,
             rsvp_data['last_updated']
-        ])
-    
-    return output.getvalue()
\ No newline at end of file
+        ]
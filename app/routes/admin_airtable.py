@@ -12,21 +12,43 @@ These routes handle:
 
 from flask import Blueprint, render_template, request, flash, redirect, url_for, jsonify, current_app
 from functools import wraps
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
+import threading
+import uuid
+from typing import Optional
 
-from app.constants import Security
+from app.admin_auth import is_admin_authenticated
+from app.services.airtable_service import get_airtable_service
+from app.services.whatsapp_service import WhatsAppService, get_whatsapp_service, send_concurrently
 
 logger = logging.getLogger(__name__)
 
 bp = Blueprint('admin_airtable', __name__, url_prefix='/admin/airtable')
 
+# In-memory store for bulk jobs (sync, send links, send reminders) running in
+# background threads. Same approach as the DOCX jobs in admin_qr: fine for a
+# single-process deployment, jobs are lost on restart.
+_bulk_jobs: dict = {}
+_bulk_jobs_lock = threading.Lock()
+
+_BULK_JOB_TTL_MINUTES = 60  # Keep finished jobs around long enough to poll
+
+API_MAX_AGE = 30  # Seconds the browser may reuse /api responses between polls
+
+_TEST_MESSAGE_TEMPLATE = (
+    "🧪 *Test Message*\n\n"
+    "This is a test from your wedding website WhatsApp integration.\n\n"
+    "Sent at: {sent_at}\n\n"
+    "If you received this, WhatsApp is working! ✅"
+)
+
 
 def admin_required(f):
     """Decorator to require admin authentication."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not request.cookies.get(Security.ADMIN_COOKIE_NAME):
+        if not is_admin_authenticated():
             return redirect(url_for('admin.login'))
         return f(*args, **kwargs)
     return decorated_function
@@ -34,12 +56,88 @@ def admin_required(f):
 
 def get_services():
     """Get Airtable and WhatsApp service instances."""
-    from app.services.airtable_service import get_airtable_service
-    from app.services.whatsapp_service import get_whatsapp_service
-    
     return get_airtable_service(), get_whatsapp_service()
 
 
+def _cacheable_api_response(response, cache_header: str):
+    """
+    Let the dashboard's browser reuse an /api response for API_MAX_AGE seconds.
+
+    Airtable itself is only hit when the service's guest cache has expired;
+    X-Cache reports whether this response was served from that cache. Once
+    max-age runs out, a poll whose body hasn't changed gets an empty 304.
+    """
+    response.add_etag()  # Hash of the serialised body
+    response.cache_control.private = True
+    response.cache_control.max_age = API_MAX_AGE
+    response.headers['X-Cache'] = cache_header
+    return response.make_conditional(request)
+
+
+def _cleanup_old_bulk_jobs() -> None:
+    """Remove jobs older than _BULK_JOB_TTL_MINUTES. Call before creating new jobs."""
+    cutoff = datetime.utcnow() - timedelta(minutes=_BULK_JOB_TTL_MINUTES)
+    with _bulk_jobs_lock:
+        expired = [jid for jid, job in _bulk_jobs.items()
+                   if job["created_at"] < cutoff]
+        for jid in expired:
+            del _bulk_jobs[jid]
+    if expired:
+        logger.info(f"Cleaned up {len(expired)} expired bulk jobs.")
+
+
+def _start_bulk_job(kind: str, work) -> Optional[str]:
+    """
+    Run ``work`` in a daemon thread and track it in the bulk job store.
+
+    ``work`` is called inside an app context and must return a dict summary
+    (e.g. ``{"sent": 3, "failed": 1}``), which is exposed via ``job_status``.
+    Only one job of each kind runs at a time, so a double-clicked button
+    doesn't send every message twice.
+
+    Returns:
+        The job id to poll, or None if a job of this kind is already running
+    """
+    _cleanup_old_bulk_jobs()
+
+    app = current_app._get_current_object()
+    job_id = str(uuid.uuid4())
+    with _bulk_jobs_lock:
+        if any(job["kind"] == kind and job["status"] == "running"
+               for job in _bulk_jobs.values()):
+            return None
+        _bulk_jobs[job_id] = {
+            "kind":       kind,
+            "status":     "running",
+            "result":     None,
+            "error":      None,
+            "created_at": datetime.utcnow(),
+        }
+
+    def _run() -> None:
+        try:
+            with app.app_context():
+                result = work()
+            with _bulk_jobs_lock:
+                _bulk_jobs[job_id]["status"] = "done"
+                _bulk_jobs[job_id]["result"] = result
+            logger.info(f"Bulk job {kind} {job_id} completed: {result}")
+        except Exception as exc:
+            logger.error(f"Bulk job {kind} {job_id} failed: {exc}", exc_info=True)
+            with _bulk_jobs_lock:
+                _bulk_jobs[job_id]["status"] = "error"
+                _bulk_jobs[job_id]["error"]  = str(exc)
+
+    thread = threading.Thread(
+        target=_run,
+        daemon=True,
+        name=f"{kind}-{job_id[:8]}",
+    )
+    thread.start()
+
+    return job_id
+
+
 # =============================================================================
 # DASHBOARD / STATUS
 # =============================================================================
@@ -63,8 +161,9 @@ def airtable_dashboard():
     
     if airtable.is_configured:
         try:
-            stats = airtable.get_statistics()
-            guests = airtable.get_all_guests()
+            # One table fetch serves both the guest list and the stats
+            guests = airtable.get_all_guests_cached()
+            stats = airtable.get_statistics(guests)
         except Exception as e:
             error = str(e)
             logger.error(f"Error fetching Airtable data: {e}")
@@ -74,7 +173,8 @@ def airtable_dashboard():
         config_status=config_status,
         stats=stats,
         guests=guests,
-        error=error
+        error=error,
+        job_id=request.args.get('job')
     )
 
 
@@ -97,16 +197,41 @@ def status():
     }
     
     # Test Airtable connection
+    cache_header = None
     if airtable.is_configured:
         try:
-            guests = airtable.get_all_guests()
+            cache_header = 'HIT' if airtable.has_fresh_cache() else 'MISS'
+            guests = airtable.get_all_guests_cached()
             status['airtable']['connected'] = True
             status['airtable']['guest_count'] = len(guests)
         except Exception as e:
             status['airtable']['connected'] = False
             status['airtable']['error'] = str(e)
     
-    return jsonify(status)
+    # Pollers that already have this payload get an empty 304
+    response = jsonify(status)
+    response.add_etag()  # Hash of the serialised body
+    if cache_header:
+        response.headers['X-Cache'] = cache_header
+    return response.make_conditional(request)
+
+
+@bp.route('/jobs/<job_id>')
+@admin_required
+def job_status(job_id):
+    """Poll the state of a background sync/send job."""
+    with _bulk_jobs_lock:
+        job = _bulk_jobs.get(job_id)
+    
+    if not job:
+        return jsonify({'error': 'Job not found or expired'}), 404
+    
+    return jsonify({
+        'kind': job['kind'],
+        'status': job['status'],
+        'result': job['result'],
+        'error': job['error'],
+    })
 
 
 # =============================================================================
@@ -116,22 +241,24 @@ def status():
 @bp.route('/sync-to-local', methods=['POST'])
 @admin_required
 def sync_to_local():
-    """Sync all guests from Airtable to local database."""
+    """Sync all guests from Airtable to local database in a background job."""
     airtable, _ = get_services()
     
     if not airtable.is_configured:
         flash('Airtable is not configured', 'error')
         return redirect(url_for('admin_airtable.airtable_dashboard'))
     
-    try:
+    def _sync():
         created, updated, deleted = airtable.sync_all_to_local_db()
-        flash(f'Sync complete: {created} created, {updated} updated, {deleted} deleted', 'success')
         logger.info(f"Airtable sync: {created} created, {updated} updated, {deleted} deleted")
-    except Exception as e:
-        flash(f'Sync failed: {str(e)}', 'error')
-        logger.error(f"Airtable sync failed: {e}")
+        return {'created': created, 'updated': updated, 'deleted': deleted}
     
-    return redirect(url_for('admin_airtable.airtable_dashboard'))
+    job_id = _start_bulk_job('sync', _sync)
+    if job_id is None:
+        flash('A sync is already running', 'warning')
+    
+    # The dashboard polls the job and shows its result when it finishes
+    return redirect(url_for('admin_airtable.airtable_dashboard', job=job_id))
 
 
 @bp.route('/generate-tokens', methods=['POST'])
@@ -191,13 +318,12 @@ def send_single_link(record_id):
     
     try:
         # Get guest from Airtable
-        guests = airtable.get_all_guests()
-        guest = next((g for g in guests if g.record_id == record_id), None)
-        
+        guest = airtable.get_guest_by_record_id(record_id)
+
         if not guest:
             flash('Guest not found', 'error')
             return redirect(url_for('admin_airtable.airtable_dashboard'))
-        
+
         # Send WhatsApp and update Airtable
         result = whatsapp.send_rsvp_link_and_update_airtable(guest, airtable)
         
@@ -216,7 +342,7 @@ def send_single_link(record_id):
 @bp.route('/send-all-links', methods=['POST'])
 @admin_required
 def send_all_links():
-    """Send RSVP links to all guests who haven't received one."""
+    """Send RSVP links, in a background job, to all guests who haven't received one."""
     airtable, whatsapp = get_services()
     
     if not airtable.is_configured or not whatsapp.is_configured:
@@ -231,19 +357,32 @@ def send_all_links():
             flash('No guests need RSVP links', 'info')
             return redirect(url_for('admin_airtable.airtable_dashboard'))
         
-        sent = 0
-        failed = 0
+        max_workers = current_app.config.get('BULK_SEND_MAX_WORKERS', 1)
         
-        for guest in guests:
-            result = whatsapp.send_rsvp_link_and_update_airtable(guest, airtable)
-            if result.success:
-                sent += 1
-            else:
-                failed += 1
-                logger.error(f"Failed to send to {guest.name}: {result.error}")
+        def _send_links():
+            sent = 0
+            failed = 0
+            
+            results = send_concurrently(
+                guests,
+                lambda guest: whatsapp.send_rsvp_link_and_update_airtable(guest, airtable),
+                max_workers
+            )
+            for guest, result in zip(guests, results):
+                if result.success:
+                    sent += 1
+                else:
+                    failed += 1
+                    logger.error(f"Failed to send to {guest.name}: {result.error}")
+            
+            logger.info(f"Bulk send links: {sent} sent, {failed} failed")
+            return {'sent': sent, 'failed': failed}
         
-        flash(f'Sent {sent} links, {failed} failed', 'success' if failed == 0 else 'warning')
-        logger.info(f"Bulk send links: {sent} sent, {failed} failed")
+        job_id = _start_bulk_job('send-links', _send_links)
+        if job_id is None:
+            flash('RSVP links are already being sent', 'warning')
+        else:
+            return redirect(url_for('admin_airtable.airtable_dashboard', job=job_id))
         
     except Exception as e:
         flash(f'Error sending links: {str(e)}', 'error')
@@ -268,8 +407,7 @@ def send_single_reminder(record_id, reminder_number):
     
     try:
         # Get guest from Airtable
-        guests = airtable.get_all_guests()
-        guest = next((g for g in guests if g.record_id == record_id), None)
+        guest = airtable.get_guest_by_record_id(record_id)
         
         if not guest:
             flash('Guest not found', 'error')
@@ -297,7 +435,7 @@ def send_single_reminder(record_id, reminder_number):
 @bp.route('/send-reminders/<int:reminder_number>', methods=['POST'])
 @admin_required
 def send_batch_reminders(reminder_number):
-    """Send a specific reminder to all guests who need it."""
+    """Send a specific reminder, in a background job, to all guests who need it."""
     airtable, whatsapp = get_services()
     
     if not airtable.is_configured or not whatsapp.is_configured:
@@ -312,25 +450,40 @@ def send_batch_reminders(reminder_number):
             flash(f'No guests need reminder {reminder_number}', 'info')
             return redirect(url_for('admin_airtable.airtable_dashboard'))
         
-        sent = 0
-        failed = 0
+        max_workers = current_app.config.get('BULK_SEND_MAX_WORKERS', 1)
         
-        for guest in guests:
-            if not guest.token:
-                logger.warning(f"Skipping {guest.name} - no token")
-                failed += 1
-                continue
+        def _send_reminders():
+            sent = 0
+            failed = 0
+            
+            with_token = []
+            for guest in guests:
+                if not guest.token:
+                    logger.warning(f"Skipping {guest.name} - no token")
+                    failed += 1
+                else:
+                    with_token.append(guest)
             
-            result = whatsapp.send_reminder_and_update_airtable(guest, airtable, reminder_number)
-            if result.success:
-                sent += 1
-            else:
-                failed += 1
-                logger.error(f"Failed to send reminder to {guest.name}: {result.error}")
+            results = send_concurrently(
+                with_token,
+                lambda guest: whatsapp.send_reminder_and_update_airtable(guest, airtable, reminder_number),
+                max_workers
+            )
+            for guest, result in zip(with_token, results):
+                if result.success:
+                    sent += 1
+                else:
+                    failed += 1
+                    logger.error(f"Failed to send reminder to {guest.name}: {result.error}")
+            
+            logger.info(f"Bulk reminder {reminder_number}: {sent} sent, {failed} failed")
+            return {'sent': sent, 'failed': failed}
         
-        flash(f'Reminder {reminder_number}: {sent} sent, {failed} failed', 
-              'success' if failed == 0 else 'warning')
-        logger.info(f"Bulk reminder {reminder_number}: {sent} sent, {failed} failed")
+        job_id = _start_bulk_job(f'reminder-{reminder_number}', _send_reminders)
+        if job_id is None:
+            flash(f'Reminder {reminder_number} is already being sent', 'warning')
+        else:
+            return redirect(url_for('admin_airtable.airtable_dashboard', job=job_id))
         
     except Exception as e:
         flash(f'Error sending reminders: {str(e)}', 'error')
@@ -362,11 +515,8 @@ def test_whatsapp():
     try:
         result = whatsapp.send_message(
             to_phone=admin_phone,
-            message=(
-                "🧪 *Test Message*\n\n"
-                "This is a test from your wedding website WhatsApp integration.\n\n"
-                f"Sent at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                "If you received this, WhatsApp is working! ✅"
+            message=_TEST_MESSAGE_TEMPLATE.format(
+                sent_at=datetime.now().isoformat(sep=' ', timespec='seconds')
             )
         )
         
@@ -386,8 +536,6 @@ def test_whatsapp():
 @admin_required
 def test_phone_normalize():
     """Test phone number normalization."""
-    from app.services.whatsapp_service import WhatsAppService
-    
     phone = request.form.get('phone', '')
     
     try:
@@ -413,8 +561,9 @@ def api_guests():
         return jsonify({'error': 'Airtable not configured'}), 400
     
     try:
-        guests = airtable.get_all_guests()
-        return jsonify({
+        cache_header = 'HIT' if airtable.has_fresh_cache() else 'MISS'
+        guests = airtable.get_all_guests_cached()
+        response = jsonify({
             'guests': [
                 {
                     'record_id': g.record_id,
@@ -429,6 +578,7 @@ def api_guests():
                 for g in guests
             ]
         })
+        return _cacheable_api_response(response, cache_header)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -443,7 +593,8 @@ def api_stats():
         return jsonify({'error': 'Airtable not configured'}), 400
     
     try:
-        stats = airtable.get_statistics()
-        return jsonify(stats)
+        cache_header = 'HIT' if airtable.has_fresh_cache() else 'MISS'
+        stats = airtable.get_statistics(airtable.get_all_guests_cached())
+        return _cacheable_api_response(jsonify(stats), cache_header)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
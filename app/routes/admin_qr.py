@@ -12,22 +12,24 @@ Async bulk download: ZIP of DOCX files is generated in a background thread
                      and download from /download-all-docx/download/<job_id> when done.
 """
 
+import io
+import re
 import threading
 import uuid
 import zipfile
 import logging
 from datetime import datetime, timedelta
-from functools import wraps
+from functools import lru_cache, wraps
 from io import BytesIO
+from urllib.parse import quote
 
-import qrcode
-import qrcode.image.svg
+import segno
 from flask import (
-    Blueprint, render_template, request, send_file,
-    redirect, url_for, current_app, jsonify
+    Blueprint, render_template, send_file,
+    redirect, url_for, current_app, jsonify, Response
 )
 
-from app.constants import Security
+from app.admin_auth import is_admin_authenticated
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +67,7 @@ def admin_required(f):
     """Decorator to require admin authentication."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not request.cookies.get(Security.ADMIN_COOKIE_NAME):
+        if not is_admin_authenticated():
             return redirect(url_for('admin.login'))
         return f(*args, **kwargs)
     return decorated_function
@@ -75,22 +77,90 @@ def admin_required(f):
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _filter_guests(all_guests: list) -> list:
+def _qr_guest_rows() -> list:
     """
-    Return only guests who should receive a QR code:
-      - Pending:   no RSVP submitted yet (guest.rsvp is None)
+    Return (id, name, surname, phone, token) rows, ordered by name, for
+    guests who should receive a QR code:
+      - Pending:   no RSVP submitted yet
       - Confirmed: RSVP submitted, is_attending=True, is_cancelled=False
+
+    Selects only the columns the QR views read, so no ORM objects or
+    RSVP relationships are loaded.
+    """
+    from app import db
+    from app.models.guest import Guest
+    from app.models.rsvp import RSVP
+
+    return (
+        db.session.query(Guest.id, Guest.name, Guest.surname, Guest.phone, Guest.token)
+        .outerjoin(RSVP, RSVP.guest_id == Guest.id)
+        .filter(db.or_(
+            RSVP.id.is_(None),
+            db.and_(RSVP.is_attending.is_(True), RSVP.is_cancelled.is_(False)),
+        ))
+        .order_by(Guest.name)
+        .all()
+    )
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only stream that hands back whatever zipfile wrote since the last drain."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _iter_zip(entries):
+    """
+    Yield a ZIP archive chunk by chunk as each (name, data_fn) entry is built.
+
+    zipfile writes data descriptors when its stream isn't seekable, so the
+    archive never has to be held in memory as a whole.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data_fn in entries:
+            zf.writestr(name, data_fn())
+            yield sink.drain()
+    # Central directory is written on close
+    yield sink.drain()
+
+
+_TOKEN_PLACEHOLDER = "__TOKEN__"
+
+
+def _rsvp_url_builder():
+    """
+    Return a function mapping a guest token to its external RSVP URL.
+
+    url_for() is resolved once with a placeholder token; the per-guest URLs
+    are then plain string substitutions, which matters in the bulk loops.
     """
-    return [
-        g for g in all_guests
-        if g.rsvp is None or (g.rsvp.is_attending and not g.rsvp.is_cancelled)
-    ]
+    template = url_for("main.index", token=_TOKEN_PLACEHOLDER, _external=True)
+    return lambda token: template.replace(_TOKEN_PLACEHOLDER, quote(token, safe=""))
+
+
+# Anything but letters/digits (accented ones included), space, '-' and '_'
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w \-]")
 
 
 def _safe_filename(name: str, surname) -> str:
     """Build a filesystem-safe filename stem from name + surname."""
     full = f"{name} {surname}" if surname else name
-    safe = "".join(c for c in full if c.isalnum() or c in (" ", "-", "_")).strip()
+    safe = _UNSAFE_FILENAME_CHARS.sub("", full).strip()
     return safe.replace(" ", "_")
 
 
@@ -106,36 +176,29 @@ def generate_qr_code(url: str, format: str = "png", size: int = 10) -> BytesIO:
     Returns:
         BytesIO buffer positioned at offset 0.
     """
+    return BytesIO(_qr_bytes(url, format, size))
+
+
+@lru_cache(maxsize=1024)
+def _qr_bytes(url: str, format: str, size: int) -> bytes:
+    """
+    Render a QR code image to bytes, memoised per (url, format, size).
+
+    The URL embeds the guest token, so a changed token is simply a new key
+    and never serves a stale image.
+    """
+    # Regular (non-micro) QR at level L, smallest version that fits
+    qr = segno.make_qr(url, error="l", boost_error=False)
+    buf = BytesIO()
     if format == "svg":
-        factory = qrcode.image.svg.SvgPathImage
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=size,
-            border=2,
-            image_factory=factory,
-        )
-        qr.add_data(url)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-        buf = BytesIO()
-        img.save(buf)
-        buf.seek(0)
-        return buf
+        # Same physical size as before: box_size / 10 mm per module.
+        # Bare <svg> with one path per colour: no XML declaration, classes or newline.
+        qr.save(buf, kind="svg", scale=size / 10, unit="mm", border=2,
+                dark="black", light="white", xmldecl=False,
+                svgclass=None, lineclass=None, nl=False)
     else:
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=size,
-            border=2,
-        )
-        qr.add_data(url)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white")
-        buf = BytesIO()
-        img.save(buf, format="PNG")
-        buf.seek(0)
-        return buf
+        qr.save(buf, kind="png", scale=size, border=2, dark="black", light="white")
+    return buf.getvalue()
 
 
 def _generate_guest_docx(name: str, surname, rsvp_url: str) -> BytesIO:
@@ -238,13 +301,13 @@ def qr_dashboard():
     """Display QR code dashboard - pending and confirmed guests only."""
     from app.models.guest import Guest
 
-    all_guests = Guest.query.order_by(Guest.name).all()
-    total_count = len(all_guests)
-    guests = _filter_guests(all_guests)
+    total_count = Guest.query.count()
+    guests = _qr_guest_rows()
+    rsvp_url_for = _rsvp_url_builder()
 
     guest_data = []
     for guest in guests:
-        rsvp_url = url_for("main.index", token=guest.token, _external=True)
+        rsvp_url = rsvp_url_for(guest.token)
         guest_data.append({
             "id":       guest.id,
             "name":     guest.name,
@@ -297,25 +360,24 @@ def preview_qr(guest_id):
 @admin_required
 def download_all_qr(format="png"):
     """Download a ZIP of QR images for pending and confirmed guests."""
-    from app.models.guest import Guest
+    guests = _qr_guest_rows()
+    ext = "svg" if format == "svg" else "png"
 
-    guests = _filter_guests(Guest.query.order_by(Guest.name).all())
-    zip_buf = BytesIO()
-
-    with zipfile.ZipFile(zip_buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        for guest in guests:
-            rsvp_url = url_for("main.index", token=guest.token, _external=True)
-            qr_buf = generate_qr_code(rsvp_url, format=format)
-            safe = _safe_filename(guest.name, guest.surname)
-            ext = "svg" if format == "svg" else "png"
-            zf.writestr(f"{safe}.{ext}", qr_buf.getvalue())
+    # Resolve names and URLs now; the generator runs after the request context ends
+    rsvp_url_for = _rsvp_url_builder()
+    entries = []
+    for guest in guests:
+        rsvp_url = rsvp_url_for(guest.token)
+        safe = _safe_filename(guest.name, guest.surname)
+        entries.append((f"{safe}.{ext}", lambda url=rsvp_url: _qr_bytes(url, format, 10)))
 
-    zip_buf.seek(0)
-    return send_file(
-        zip_buf,
+    # Stream the archive as each QR code is encoded
+    return Response(
+        _iter_zip(entries),
         mimetype="application/zip",
-        as_attachment=True,
-        download_name=f"wedding_qr_codes_{format}.zip",
+        headers={
+            "Content-Disposition": f"attachment; filename=wedding_qr_codes_{format}.zip"
+        },
     )
 
 
@@ -323,12 +385,11 @@ def download_all_qr(format="png"):
 @admin_required
 def printable_sheet():
     """Printable sheet of QR codes - pending and confirmed guests only."""
-    from app.models.guest import Guest
-
-    guests = _filter_guests(Guest.query.order_by(Guest.name).all())
+    guests = _qr_guest_rows()
+    rsvp_url_for = _rsvp_url_builder()
     guest_data = []
     for guest in guests:
-        rsvp_url = url_for("main.index", token=guest.token, _external=True)
+        rsvp_url = rsvp_url_for(guest.token)
         guest_data.append({
             "id":       guest.id,
             "name":     guest.name,
@@ -390,15 +451,13 @@ def start_download_all_docx():
     The background thread only does CPU/IO work with plain Python dicts —
     no SQLAlchemy session, no Flask proxy objects.
     """
-    from app.models.guest import Guest
-
     _cleanup_old_jobs()
 
     # Collect guest data while we have the app/request context
-    all_guests = Guest.query.order_by(Guest.name).all()
     guests_data = []
-    for g in _filter_guests(all_guests):
-        rsvp_url = url_for("main.index", token=g.token, _external=True)
+    rsvp_url_for = _rsvp_url_builder()
+    for g in _qr_guest_rows():
+        rsvp_url = rsvp_url_for(g.token)
         guests_data.append({
             "name":      g.name,
             "surname":   g.surname,
@@ -610,12 +669,10 @@ def download_all_pdf():
     Download a single PDF with one A6 landscape QR card per guest
     (pending and confirmed only).
     """
-    from app.models.guest import Guest
- 
-    all_guests = Guest.query.order_by(Guest.name).all()
     guests_data = []
-    for g in _filter_guests(all_guests):
-        rsvp_url = url_for("main.index", token=g.token, _external=True)
+    rsvp_url_for = _rsvp_url_builder()
+    for g in _qr_guest_rows():
+        rsvp_url = rsvp_url_for(g.token)
         guests_data.append({
             "name":    g.name,
             "surname": g.surname,
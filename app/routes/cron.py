@@ -10,14 +10,27 @@ Security: All endpoints require a secret key passed as a query parameter.
 
 import os
 import logging
-from datetime import datetime, date, timedelta
-from typing import Optional
+import threading
+from datetime import date, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 from flask import Blueprint, request, jsonify, current_app
 
+from app.utils.dates import parse_config_date
+
 logger = logging.getLogger(__name__)
 
 bp = Blueprint('cron', __name__, url_prefix='/api/cron')
 
+# Reminder schedule: days before deadline -> reminder number
+REMINDER_SCHEDULE = {
+    30: 1,  # 30 days before = Reminder 1
+    14: 2,  # 14 days before = Reminder 2
+    7: 3,   # 7 days before = Reminder 3
+    3: 4,   # 3 days before = Reminder 4 (final)
+}
+
 
 def verify_cron_secret(f):
     """Decorator to verify cron secret key."""
@@ -41,6 +54,31 @@ def verify_cron_secret(f):
     return decorated_function
 
 
+def run_exclusively(f):
+    """
+    Decorator that lets only one call of the endpoint run at a time.
+    
+    A second call while the first is still in progress (e.g. the scheduler
+    retrying a slow request) gets 409 instead of sending every message again.
+    """
+    from functools import wraps
+    
+    lock = threading.Lock()
+    
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not lock.acquire(blocking=False):
+            logger.warning(f"{request.path} called while a previous call is still running")
+            return jsonify({'status': 'busy', 'error': 'Already running'}), 409
+        
+        try:
+            return f(*args, **kwargs)
+        finally:
+            lock.release()
+    
+    return decorated_function
+
+
 def get_reminder_for_today(rsvp_deadline: date, today: date = None) -> Optional[int]:
     """
     Determine which reminder (if any) should be sent today.
@@ -55,39 +93,34 @@ def get_reminder_for_today(rsvp_deadline: date, today: date = None) -> Optional[
     if today is None:
         today = date.today()
     
-    # Reminder schedule: days before deadline -> reminder number
-    reminder_schedule = {
-        30: 1,  # 30 days before = Reminder 1
-        14: 2,  # 14 days before = Reminder 2
-        7: 3,   # 7 days before = Reminder 3
-        3: 4,   # 3 days before = Reminder 4 (final)
-    }
-    
     days_until_deadline = (rsvp_deadline - today).days
     
-    return reminder_schedule.get(days_until_deadline)
+    return REMINDER_SCHEDULE.get(days_until_deadline)
 
 
-def calculate_reminder_dates(rsvp_deadline: date) -> dict:
+@lru_cache(maxsize=8)
+def calculate_reminder_dates(rsvp_deadline: date) -> Mapping[int, date]:
     """
     Calculate all reminder dates for a given deadline.
     
+    Memoised per deadline; the result is a read-only view because it is
+    shared between calls.
+    
     Args:
         rsvp_deadline: The RSVP deadline date
         
     Returns:
-        Dict mapping reminder number to date
+        Read-only mapping of reminder number to date
     """
-    return {
-        1: rsvp_deadline - timedelta(days=30),
-        2: rsvp_deadline - timedelta(days=14),
-        3: rsvp_deadline - timedelta(days=7),
-        4: rsvp_deadline - timedelta(days=3),
-    }
+    return MappingProxyType({
+        reminder_number: rsvp_deadline - timedelta(days=days_before)
+        for days_before, reminder_number in REMINDER_SCHEDULE.items()
+    })
 
 
 @bp.route('/send-reminders', methods=['GET', 'POST'])
 @verify_cron_secret
+@run_exclusively
 def send_reminders():
     """
     Send scheduled WhatsApp reminders.
@@ -105,10 +138,10 @@ def send_reminders():
     """
     try:
         # Get RSVP deadline from config
-        from app.constants import DEFAULT_CONFIG, DateFormat
+        from app.constants import DEFAULT_CONFIG
         
         rsvp_deadline_str = current_app.config.get('RSVP_DEADLINE', DEFAULT_CONFIG['RSVP_DEADLINE'])
-        rsvp_deadline = datetime.strptime(rsvp_deadline_str, DateFormat.DATABASE).date()
+        rsvp_deadline = parse_config_date(rsvp_deadline_str)
         
         today = date.today()
         
@@ -142,7 +175,7 @@ def send_reminders():
         
         # Get services
         from app.services.airtable_service import get_airtable_service
-        from app.services.whatsapp_service import get_whatsapp_service
+        from app.services.whatsapp_service import get_whatsapp_service, send_concurrently
         
         airtable = get_airtable_service()
         whatsapp = get_whatsapp_service()
@@ -177,6 +210,20 @@ def send_reminders():
             'details': []
         }
         
+        # Send to every guest with a token up front, several at a time;
+        # results come back in guest order for the report below
+        send_results = iter([])
+        if not dry_run:
+            send_results = iter(send_concurrently(
+                [guest for guest in guests if guest.token],
+                lambda guest: whatsapp.send_reminder_and_update_airtable(
+                    airtable_guest=guest,
+                    airtable_service=airtable,
+                    reminder_number=reminder_number
+                ),
+                current_app.config.get('BULK_SEND_MAX_WORKERS', 1)
+            ))
+        
         for guest in guests:
             if not guest.token:
                 results['failed'] += 1
@@ -197,12 +244,8 @@ def send_reminders():
                     'would_send': f'Reminder {reminder_number}'
                 })
             else:
-                # Send the reminder
-                result = whatsapp.send_reminder_and_update_airtable(
-                    airtable_guest=guest,
-                    airtable_service=airtable,
-                    reminder_number=reminder_number
-                )
+                # Result of the reminder sent above
+                result = next(send_results)
                 
                 if result.success:
                     results['sent'] += 1
@@ -246,11 +289,11 @@ def cron_status():
     Returns upcoming reminder dates and current configuration.
     """
     try:
-        from app.constants import DEFAULT_CONFIG, DateFormat
+        from app.constants import DEFAULT_CONFIG
         from app.services.airtable_service import get_airtable_service
         
         rsvp_deadline_str = current_app.config.get('RSVP_DEADLINE', DEFAULT_CONFIG['RSVP_DEADLINE'])
-        rsvp_deadline = datetime.strptime(rsvp_deadline_str, DateFormat.DATABASE).date()
+        rsvp_deadline = parse_config_date(rsvp_deadline_str)
         
         today = date.today()
         days_left = (rsvp_deadline - today).days
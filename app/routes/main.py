@@ -1,12 +1,19 @@
 # app/routes/main.py
 from flask import Blueprint, render_template, request, session
 from app import db
+from app.constants import TimeLimit
 from app.services.guest_service import GuestService
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 bp = Blueprint('main', __name__)
 
+# When the database last answered a health check; only successes are cached
+_db_healthy_at = None
+_db_healthy_lock = threading.Lock()
+
 
 @bp.route('/')
 def index():
@@ -18,7 +25,7 @@ def index():
     # Check for token in URL query param
     token = request.args.get('token')
     if token:
-        guest = GuestService.get_guest_by_token(token)
+        guest = GuestService.get_guest_with_rsvp_by_token(token)
         if guest:
             session['guest_token'] = token
             logger.info(f"Guest token stored in session: {guest.name}")
@@ -27,9 +34,9 @@ def index():
     if not guest:
         token = session.get('guest_token')
         if token:
-            guest = GuestService.get_guest_by_token(token)
+            guest = GuestService.get_guest_with_rsvp_by_token(token)
             if guest:
-                logger.debug(f"Guest retrieved from session: {guest.name}")
+                logger.debug("Guest retrieved from session: %s", guest.name)
             else:
                 # Invalid token in session, clear it
                 session.pop('guest_token', None)
@@ -46,11 +53,25 @@ def index():
 @bp.route('/health')
 def health():
     """Health check endpoint for Railway/load balancers."""
+    global _db_healthy_at
+    
+    # The lock only guards the timestamp; the ping itself runs outside it so
+    # a hung database can't queue every probe behind one connect timeout
+    with _db_healthy_lock:
+        healthy_at = _db_healthy_at
+    if (healthy_at is not None
+            and time.monotonic() - healthy_at < TimeLimit.HEALTH_CHECK_CACHE_TIMEOUT):
+        return {'status': 'healthy', 'database': 'connected'}, 200
+    
     try:
         # Quick database connectivity check
-        db.session.execute(db.text('SELECT 1'))
+        db.session.execute(db.text('SELECT 1')).scalar()
+        with _db_healthy_lock:
+            _db_healthy_at = time.monotonic()
         return {'status': 'healthy', 'database': 'connected'}, 200
     except Exception as e:
+        with _db_healthy_lock:
+            _db_healthy_at = None
         logger.error(f"Health check failed: {str(e)}")
         return {'status': 'unhealthy', 'error': str(e)}, 503
 
@@ -58,10 +79,13 @@ def health():
 @bp.route('/seed-allergens')
 def seed_allergens():
     """One-time endpoint to seed allergens."""
+    from sqlalchemy import insert
     from app.models.allergen import Allergen
+    from app.services.allergen_service import AllergenService
     
-    if Allergen.query.count() > 0:
-        return {'status': 'already seeded', 'count': Allergen.query.count()}
+    existing = Allergen.query.count()
+    if existing > 0:
+        return {'status': 'already seeded', 'count': existing}
     
     common_allergens = [
         'Gluten', 'Dairy', 'Nuts (Tree nuts)', 'Peanuts',
@@ -71,10 +95,10 @@ def seed_allergens():
         'Kosher', 'Halal'
     ]
     
-    for name in common_allergens:
-        db.session.add(Allergen(name=name))
-    
+    # One executemany INSERT, no ORM objects
+    db.session.execute(insert(Allergen), [{'name': name} for name in common_allergens])
     db.session.commit()
+    AllergenService.invalidate_allergen_options_cache()
     return {'status': 'seeded', 'count': len(common_allergens)}
 
 
@@ -87,13 +111,18 @@ def clear_and_sync():
     from app.services.airtable_service import get_airtable_service
     
     # Delete all RSVPs and guests
-    GuestAllergen.query.delete()
-    RSVP.query.delete()
-    Guest.query.delete()
+    if db.engine.dialect.name == 'postgresql':
+        # One statement; additional_guest rows go with their RSVPs
+        db.session.execute(db.text('TRUNCATE guest_allergen, rsvp, guest CASCADE'))
+    else:
+        # Plain DELETEs (SQLite has no TRUNCATE), nothing loaded into the session
+        GuestAllergen.query.delete(synchronize_session=False)
+        RSVP.query.delete(synchronize_session=False)
+        Guest.query.delete(synchronize_session=False)
     db.session.commit()
     
     # Sync from Airtable
     airtable = get_airtable_service()
-    created, updated = airtable.sync_all_to_local_db()
+    created, updated, deleted = airtable.sync_all_to_local_db()
     
-    return {'status': 'cleared and synced', 'created': created, 'updated': updated}
\ No newline at end of file
+    return {'status': 'cleared and synced', 'created': created, 'updated': updated, 'deleted': deleted}
\ No newline at end of file
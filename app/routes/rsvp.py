@@ -4,7 +4,7 @@ from app.services.guest_service import GuestService
 from app.services.rsvp_service import RSVPService
 from app.services.allergen_service import AllergenService
 from app.forms import RSVPForm
-from app.security import rate_limit
+from app.security import rate_limit, guest_token_key
 from app.constants import (
     LogMessage, HttpStatus, TimeLimit, Template, DEFAULT_CONFIG
 )
@@ -15,14 +15,17 @@ logger = logging.getLogger(__name__)
 bp = Blueprint('rsvp', __name__, url_prefix='/rsvp')
 
 
-def get_guest_from_session():
-    """Get guest from session token. Returns (guest, error_response) tuple."""
+def get_guest_from_session(rsvp_details=False):
+    """
+    Get guest from session token, with guest.rsvp already loaded.
+    Returns (guest, error_response) tuple.
+    """
     token = session.get('guest_token')
     if not token:
         logger.warning("No token in session, redirecting to home")
         return None, redirect(url_for('main.index'))
     
-    guest = GuestService.get_guest_by_token(token)
+    guest = GuestService.get_guest_with_rsvp_by_token(token, rsvp_details=rsvp_details)
     if not guest:
         logger.warning(f"Invalid token in session: {token}")
         session.pop('guest_token', None)
@@ -32,10 +35,11 @@ def get_guest_from_session():
 
 
 @bp.route('', methods=['GET'])
-@rate_limit(max_requests=TimeLimit.RATE_LIMIT_MAX_REQUESTS, window=TimeLimit.RATE_LIMIT_WINDOW)
+@rate_limit(max_requests=TimeLimit.RATE_LIMIT_MAX_REQUESTS, window=TimeLimit.RATE_LIMIT_WINDOW,
+            key_func=guest_token_key)
 def rsvp():
     """Handle RSVP - show summary if submitted, form if not."""
-    guest, error_response = get_guest_from_session()
+    guest, error_response = get_guest_from_session(rsvp_details=True)
     if error_response:
         return error_response
     
@@ -51,7 +55,7 @@ def rsvp():
         return redirect(url_for('main.index', deadline_passed=1))
     
     # Get existing RSVP if any
-    rsvp = RSVPService.get_rsvp_by_guest_id(guest.id)
+    rsvp = guest.rsvp
     
     # If RSVP exists and is not cancelled, show summary page
     if rsvp and not rsvp.is_cancelled:
@@ -62,7 +66,7 @@ def rsvp():
                              admin_phone=admin_phone)
     
     # No RSVP yet (or cancelled) - show form
-    allergens = AllergenService.get_all_allergens()
+    allergens = AllergenService.get_allergen_options()
     form = RSVPForm(obj=rsvp, guest=guest)
     
     return render_template('rsvp.html',
@@ -77,10 +81,11 @@ def rsvp():
 
 
 @bp.route('/edit', methods=['GET', 'POST'])
-@rate_limit(max_requests=TimeLimit.RATE_LIMIT_MAX_REQUESTS, window=TimeLimit.RATE_LIMIT_WINDOW)
+@rate_limit(max_requests=TimeLimit.RATE_LIMIT_MAX_REQUESTS, window=TimeLimit.RATE_LIMIT_WINDOW,
+            key_func=guest_token_key)
 def edit():
     """Handle RSVP form editing."""
-    guest, error_response = get_guest_from_session()
+    guest, error_response = get_guest_from_session(rsvp_details=True)
     if error_response:
         return error_response
     
@@ -95,7 +100,7 @@ def edit():
         return redirect(url_for('main.index', deadline_passed=1))
     
     # Get existing RSVP
-    rsvp = RSVPService.get_rsvp_by_guest_id(guest.id)
+    rsvp = guest.rsvp
     
     # Check editability
     readonly = False
@@ -106,12 +111,6 @@ def edit():
         show_warning = True
         flash('Changes are not possible at this time. Please contact ' + admin_phone + ' for assistance.', 'warning')
     
-    # Get allergens for form
-    allergens = AllergenService.get_all_allergens()
-    
-    # Initialize form
-    form = RSVPForm(obj=rsvp, guest=guest)
-    
     if request.method == 'POST' and not readonly:
         logger.info(f"Processing POST request for RSVP form, guest: {guest.name}")
         
@@ -124,6 +123,10 @@ def edit():
         else:
             flash(message, 'danger')
     
+    # Only needed to render; a successful POST redirects before this
+    allergens = AllergenService.get_allergen_options()
+    form = RSVPForm(obj=rsvp, guest=guest)
+    
     # Render form
     return render_template('rsvp.html',
                          guest=guest,
@@ -146,7 +149,7 @@ def cancel():
     
     try:
         # Check if guest has RSVP
-        rsvp = RSVPService.get_rsvp_by_guest_id(guest.id)
+        rsvp = guest.rsvp
         if not rsvp:
             flash('No RSVP found to cancel.', 'warning')
             return redirect(url_for('rsvp.rsvp'))
@@ -1,7 +1,8 @@
 # app/security.py
 """Security utilities for the wedding website."""
-from flask import request, abort, current_app
+from flask import request, abort, current_app, session
 from functools import wraps
+import threading
 import time
 from app.constants import HttpStatus, TimeLimit
 
@@ -9,6 +10,8 @@ from app.constants import HttpStatus, TimeLimit
 # Note: This resets on app restart and doesn't share across workers.
 # For a wedding website with single-worker deployment, this is acceptable.
 _rate_limit_storage = {}
+_rate_limit_lock = threading.Lock()
+_rate_limit_cleaned_at = 0.0
 
 
 def configure_security(app):
@@ -17,47 +20,65 @@ def configure_security(app):
     pass
 
 
-def rate_limit(max_requests=TimeLimit.RATE_LIMIT_MAX_REQUESTS, window=TimeLimit.RATE_LIMIT_WINDOW):
+def guest_token_key():
+    """Rate limit key for guest pages: the guest's session token, if any."""
+    return session.get('guest_token')
+
+
+def rate_limit(max_requests=TimeLimit.RATE_LIMIT_MAX_REQUESTS, window=TimeLimit.RATE_LIMIT_WINDOW,
+               key_func=None):
     """
     Simple rate limiting decorator.
     
-    Limits requests to max_requests per window seconds per IP address.
+    Limits requests to max_requests per window seconds per client. Clients
+    are identified by key_func() when given and it returns a value, otherwise
+    by IP address.
     
     Args:
         max_requests: Maximum number of requests allowed in the window
         window: Time window in seconds
+        key_func: Optional callable returning the client identity
     """
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
+            global _rate_limit_cleaned_at
+            
             # Skip rate limiting for testing
             if current_app.config.get('TESTING'):
                 return f(*args, **kwargs)
             
-            ip = request.remote_addr
+            client = (key_func() if key_func else None) or request.remote_addr
             now = time.time()
-            key = f"{ip}:{f.__name__}"
-            
-            # Get or create rate limit record for this IP + endpoint
-            if key not in _rate_limit_storage:
-                _rate_limit_storage[key] = {'count': 0, 'window_start': now}
-            
-            record = _rate_limit_storage[key]
+            key = f"{client}:{f.__name__}"
             
-            # Reset window if expired
-            if now - record['window_start'] > window:
-                record['count'] = 0
-                record['window_start'] = now
+            # Check-and-increment must be atomic across request threads
+            with _rate_limit_lock:
+                # Drop stale clients now and then so the dict can't grow forever
+                if now - _rate_limit_cleaned_at > TimeLimit.RATE_LIMIT_WINDOW:
+                    cleanup_rate_limit_storage()
+                    _rate_limit_cleaned_at = now
+                
+                # Get or create rate limit record for this client + endpoint
+                record = _rate_limit_storage.setdefault(key, {'count': 0, 'window_start': now})
+                
+                # Reset window if expired
+                if now - record['window_start'] > window:
+                    record['count'] = 0
+                    record['window_start'] = now
+                
+                # Increment counter unless the limit is already reached
+                limited = record['count'] >= max_requests
+                if not limited:
+                    record['count'] += 1
             
-            # Check if rate limit exceeded
-            if record['count'] >= max_requests:
+            if limited:
+                # Log the IP, never the key: a guest token is a login credential
                 current_app.logger.warning(
-                    f"Rate limit exceeded for IP {ip} on {f.__name__}"
+                    f"Rate limit exceeded for {request.remote_addr} on {f.__name__}"
                 )
                 abort(HttpStatus.TOO_MANY_REQUESTS)
             
-            # Increment counter and proceed
-            record['count'] += 1
             return f(*args, **kwargs)
         
         return decorated_function
@@ -67,7 +88,7 @@ def rate_limit(max_requests=TimeLimit.RATE_LIMIT_MAX_REQUESTS, window=TimeLimit.
 def cleanup_rate_limit_storage():
     """
     Remove expired entries from rate limit storage.
-    Call this periodically to prevent memory growth.
+    Called by rate_limit under _rate_limit_lock about once per window.
     """
     now = time.time()
     expired_keys = [
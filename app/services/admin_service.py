@@ -1,6 +1,7 @@
 # app/services/admin_service.py
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from sqlalchemy.orm import joinedload, selectinload
 from app import db
 from app.models.guest import Guest
 from app.models.rsvp import RSVP
@@ -46,7 +47,7 @@ class AdminService:
         # Get basic data
         guests = GuestService.get_all_guests()
         rsvps = RSVPService.get_all_rsvps()
-        allergens = AllergenService.get_all_allergens()
+        allergens = AllergenService.get_allergen_options()
         
         # Get statistics
         statistics = GuestService.get_guest_statistics()
@@ -64,21 +65,40 @@ class AdminService:
         return dashboard_data
     
     @staticmethod
-    def get_detailed_rsvp_report() -> List[Dict[str, Any]]:
+    def get_export_rsvps() -> List[RSVP]:
+        """
+        Get every RSVP with its guest, plus-ones and allergens loaded up front.
+        
+        Returns:
+            List of RSVPs that can be read without further queries
+        """
+        # A fixed handful of queries instead of several per RSVP
+        return RSVP.query.options(
+            joinedload(RSVP.guest),
+            selectinload(RSVP.additional_guests),
+            selectinload(RSVP.allergens).joinedload(GuestAllergen.allergen),
+        ).all()
+    
+    @staticmethod
+    def get_detailed_rsvp_report(rsvps: Optional[List[RSVP]] = None) -> List[Dict[str, Any]]:
         """
         Get detailed RSVP report for export.
         
+        Args:
+            rsvps: RSVPs already loaded by get_export_rsvps() (optional)
+        
         Returns:
             List of dictionaries containing RSVP details
         """
         report = []
-        rsvps = RSVP.query.all()
+        if rsvps is None:
+            rsvps = AdminService.get_export_rsvps()
         
         for rsvp in rsvps:
             guest = rsvp.guest
             
             # Get allergens grouped by guest
-            allergens = AllergenService.get_allergens_for_rsvp(rsvp.id)
+            allergens = AllergenService.group_allergens_by_guest(rsvp.allergens)
             
             # Count children with/without menu
             children_with_menu = 0
@@ -165,17 +185,21 @@ class AdminService:
         }
     
     @staticmethod
-    def get_transport_report() -> Dict[str, Any]:
+    def get_transport_report(attending_rsvps: Optional[List[RSVP]] = None) -> Dict[str, Any]:
         """
         Get detailed transport requirements report.
         
+        Args:
+            attending_rsvps: Attending RSVPs already loaded by the caller (optional)
+        
         Returns:
             Dictionary containing transport information
         """
-        transport_summary = RSVPService.get_transport_summary()
-        
         # Get detailed lists
-        attending_rsvps = RSVPService.get_attending_rsvps()
+        if attending_rsvps is None:
+            attending_rsvps = RSVPService.get_attending_rsvps()
+        
+        transport_summary = RSVPService.get_transport_summary(attending_rsvps)
         
         to_reception = []
         to_hotel = []
@@ -294,16 +318,8 @@ class AdminService:
         Returns:
             List of guests without RSVPs
         """
-        # Get all guest IDs that have RSVPs
-        guest_ids_with_rsvp = db.session.query(RSVP.guest_id).all()
-        guest_ids_with_rsvp = [id[0] for id in guest_ids_with_rsvp]
-        
-        # Get guests without RSVPs
-        pending_guests = Guest.query.filter(
-            ~Guest.id.in_(guest_ids_with_rsvp)
-        ).all()
-        
-        return pending_guests
+        # Single NOT EXISTS query instead of materialising every RSVP guest_id
+        return Guest.query.filter(~Guest.rsvp.has()).all()
     
     @staticmethod
     def generate_csv_template() -> str:
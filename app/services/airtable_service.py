@@ -13,11 +13,15 @@ This service handles:
 import os
 import secrets
 import logging
+import threading
+import time
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from app.constants import TimeLimit
+
 logger = logging.getLogger(__name__)
 
 
@@ -119,6 +123,11 @@ class AirtableService:
         
         self._client = None
         self._table = None
+        
+        # Short-lived copy of the full guest list for read-only admin views
+        self._guests_cache: Optional[List[AirtableGuest]] = None
+        self._guests_cache_at = 0.0
+        self._cache_lock = threading.Lock()
     
     @property
     def is_configured(self) -> bool:
@@ -168,6 +177,69 @@ class AirtableService:
             logger.error(f"Failed to fetch guests from Airtable: {e}")
             raise
     
+    def get_all_guests_cached(
+        self, max_age: int = TimeLimit.AIRTABLE_CACHE_TIMEOUT
+    ) -> List[AirtableGuest]:
+        """
+        Fetch all guests, reusing a recent result when one is available.
+        
+        Meant for dashboards and status pages; anything that writes back to
+        Airtable should use get_all_guests() for fresh data. The cache is
+        dropped whenever this service updates a record.
+        
+        Args:
+            max_age: Maximum age of the cached list in seconds
+            
+        Returns:
+            List of AirtableGuest objects
+        """
+        with self._cache_lock:
+            if (self._guests_cache is not None
+                    and time.monotonic() - self._guests_cache_at < max_age):
+                return list(self._guests_cache)
+        
+        guests = self.get_all_guests()
+        
+        with self._cache_lock:
+            self._guests_cache = guests
+            self._guests_cache_at = time.monotonic()
+        
+        return list(guests)
+    
+    def has_fresh_cache(self, max_age: int = TimeLimit.AIRTABLE_CACHE_TIMEOUT) -> bool:
+        """Check whether get_all_guests_cached() would be served from memory."""
+        with self._cache_lock:
+            return (self._guests_cache is not None
+                    and time.monotonic() - self._guests_cache_at < max_age)
+    
+    def invalidate_cache(self) -> None:
+        """Drop the cached guest list so the next read hits Airtable."""
+        with self._cache_lock:
+            self._guests_cache = None
+
+    def get_guest_by_record_id(self, record_id: str) -> Optional[AirtableGuest]:
+        """
+        Fetch a single guest by Airtable record ID.
+
+        Uses the single-record endpoint instead of pulling the whole table.
+
+        Args:
+            record_id: Airtable record ID
+
+        Returns:
+            AirtableGuest or None if the record does not exist
+        """
+        try:
+            record = self.table.get(record_id)
+            return AirtableGuest.from_airtable_record(record)
+        except Exception as e:
+            # pyairtable raises requests' HTTPError for unknown record IDs
+            response = getattr(e, 'response', None)
+            if getattr(response, 'status_code', None) == 404:
+                return None
+            logger.error(f"Failed to fetch guest {record_id}: {e}")
+            raise
+
     def get_guest_by_phone(self, phone: str) -> Optional[AirtableGuest]:
         """
         Find a guest by phone number.
@@ -272,6 +344,11 @@ class AirtableService:
     # WRITE OPERATIONS
     # =========================================================================
     
+    def _update_record(self, record_id: str, fields: Dict[str, Any]) -> None:
+        """Update an Airtable record and drop the cached guest list."""
+        self.table.update(record_id, fields)
+        self.invalidate_cache()
+    
     def generate_token_for_guest(self, record_id: str) -> str:
         """
         Generate and save a unique token for a guest.
@@ -291,7 +368,7 @@ class AirtableService:
                 token = secrets.token_urlsafe(32)
             
             # Update Airtable record
-            self.table.update(record_id, {'Token': token})
+            self._update_record(record_id, {'Token': token})
             logger.info(f"Generated token for record {record_id}")
             
             return token
@@ -333,7 +410,7 @@ class AirtableService:
         """
         try:
             sent_at = sent_at or datetime.now()
-            self.table.update(record_id, {
+            self._update_record(record_id, {
                 'Link Sent': sent_at.isoformat()
             })
             logger.info(f"Updated Link Sent for record {record_id}")
@@ -359,7 +436,7 @@ class AirtableService:
             sent_at = sent_at or datetime.now()
             reminder_field = f"Reminder {reminder_number}"
             
-            self.table.update(record_id, {
+            self._update_record(record_id, {
                 reminder_field: sent_at.isoformat()
             })
             logger.info(f"Updated {reminder_field} for record {record_id}")
@@ -419,7 +496,7 @@ class AirtableService:
             if transport_hotel is not None:
                 fields['Transport Hotel'] = transport_hotel
             
-            self.table.update(record_id, fields)
+            self._update_record(record_id, fields)
             logger.info(f"Updated RSVP status to {status.value} for record {record_id}")
         except Exception as e:
             logger.error(f"Failed to update RSVP status: {e}")
@@ -501,7 +578,7 @@ class AirtableService:
                 local_guest.token = airtable_guest.token
                 local_guest.personal_message = airtable_guest.personal_message
 
-            logger.debug(f"Updated local guest: {local_guest.name}")
+            logger.debug("Updated local guest: %s", local_guest.name)
         else:
             # Create new guest
             token = airtable_guest.token or secrets.token_urlsafe(32)
@@ -521,12 +598,12 @@ class AirtableService:
             # so both systems stay in sync and future syncs don't overwrite it
             if not airtable_guest.token:
                 try:
-                    self.table.update(airtable_guest.record_id, {'Token': token})
+                    self._update_record(airtable_guest.record_id, {'Token': token})
                     logger.info(f"Pushed generated token to Airtable for {local_guest.name}")
                 except Exception as e:
                     logger.warning(f"Failed to push token to Airtable for {local_guest.name}: {e}")
             
-            logger.debug(f"Created local guest: {local_guest.name}")
+            logger.debug("Created local guest: %s", local_guest.name)
         
         # Always sync RSVP status
         rsvp = RSVP.query.filter_by(guest_id=local_guest.id).first()
@@ -535,7 +612,7 @@ class AirtableService:
             # Pending = no RSVP record (or delete existing one)
             if rsvp:
                 db.session.delete(rsvp)
-                logger.debug(f"Deleted RSVP for {local_guest.name} (now Pending)")
+                logger.debug("Deleted RSVP for %s (now Pending)", local_guest.name)
         else:
             # Attending, Declined, or Cancelled - create/update RSVP
             if not rsvp:
@@ -565,7 +642,7 @@ class AirtableService:
                 rsvp.created_at = airtable_guest.rsvp_date
                 rsvp.last_updated = airtable_guest.rsvp_date
             
-            logger.debug(f"Synced RSVP for {local_guest.name}: {airtable_guest.status}")
+            logger.debug("Synced RSVP for %s: %s", local_guest.name, airtable_guest.status)
         
         db.session.commit()
         return local_guest
@@ -579,6 +656,7 @@ class AirtableService:
         """
         from app import db
         from app.models.guest import Guest
+        from app.services.guest_service import GuestService
         
         airtable_guests = self.get_all_guests()
         
@@ -586,18 +664,26 @@ class AirtableService:
         airtable_tokens = {ag.token for ag in airtable_guests if ag.token}
         airtable_phones = {ag.phone for ag in airtable_guests if ag.phone}
         
+        # Tokens and phones already in the local DB, read once rather than
+        # looked up per guest, to count creates vs updates
+        local_tokens = set()
+        local_phones = set()
+        for token, phone in db.session.query(Guest.token, Guest.phone):
+            local_tokens.add(token)
+            if phone:
+                local_phones.add(phone)
+        
         created = 0
         updated = 0
         
         for ag in airtable_guests:
-            # Check if exists
-            existing = None
-            if ag.token:
-                existing = Guest.query.filter_by(token=ag.token).first()
-            if not existing and ag.phone:
-                existing = Guest.query.filter_by(phone=ag.phone).first()
+            existing = ((ag.token and ag.token in local_tokens)
+                        or (ag.phone and ag.phone in local_phones))
             
-            self.sync_guest_to_local_db(ag)
+            local_guest = self.sync_guest_to_local_db(ag)
+            local_tokens.add(local_guest.token)
+            if local_guest.phone:
+                local_phones.add(local_guest.phone)
             
             if existing:
                 updated += 1
@@ -620,6 +706,7 @@ class AirtableService:
                 deleted += 1
         
         db.session.commit()
+        GuestService.invalidate_statistics_cache()
         
         logger.info(f"Synced from Airtable: {created} created, {updated} updated, {deleted} deleted")
         return created, updated, deleted
@@ -697,15 +784,19 @@ class AirtableService:
     # STATISTICS
     # =========================================================================
     
-    def get_statistics(self) -> Dict[str, Any]:
+    def get_statistics(self, guests: Optional[List[AirtableGuest]] = None) -> Dict[str, Any]:
         """
         Get summary statistics from Airtable.
         
+        Args:
+            guests: Already-fetched guest list to reuse instead of pulling
+                the whole table again
+        
         Returns:
             Dictionary with guest/RSVP statistics
         """
         try:
-            all_guests = self.get_all_guests()
+            all_guests = guests if guests is not None else self.get_all_guests()
             
             stats = {
                 'total_guests': len(all_guests),
@@ -1,12 +1,30 @@
 # app/services/allergen_service.py
 import logging
-from typing import Dict, Any, List
+import threading
+import time
+from typing import Dict, Any, List, NamedTuple, Optional
+from flask import current_app
+from sqlalchemy import insert
 from app import db
+from app.constants import TimeLimit
 from app.models.allergen import Allergen, GuestAllergen
 
 logger = logging.getLogger(__name__)
 
 
+class AllergenOption(NamedTuple):
+    """Plain (id, name) pair for allergen checkboxes; safe to share across requests."""
+    id: int
+    name: str
+
+
+# Cached result of get_allergen_options(); dropped when allergens are added
+# and otherwise refreshed after ALLERGEN_CACHE_TIMEOUT seconds
+_allergen_options_cache: Optional[List[AllergenOption]] = None
+_allergen_options_cache_at = 0.0
+_allergen_options_cache_lock = threading.Lock()
+
+
 class AllergenService:
     """Service class for handling allergen-related business logic."""
     
@@ -15,6 +33,51 @@ class AllergenService:
         """Get all available allergens."""
         return Allergen.query.all()
     
+    @staticmethod
+    def get_allergen_options() -> List[AllergenOption]:
+        """
+        Get the allergen checkbox options for the RSVP form, cached for a while.
+        
+        The list is effectively static, so the RSVP pages don't need to query
+        it on every request. Plain tuples are cached rather than ORM objects,
+        which would be detached once the request's session ends.
+        
+        Returns:
+            List of AllergenOption tuples in database order
+        """
+        global _allergen_options_cache, _allergen_options_cache_at
+        
+        timeout = current_app.config.get('ALLERGEN_CACHE_TIMEOUT', TimeLimit.ALLERGEN_CACHE_TIMEOUT)
+        
+        with _allergen_options_cache_lock:
+            if (timeout and _allergen_options_cache is not None
+                    and time.monotonic() - _allergen_options_cache_at < timeout):
+                return list(_allergen_options_cache)
+        
+        options = [
+            AllergenOption(id, name)
+            for id, name in db.session.query(Allergen.id, Allergen.name).order_by(Allergen.id)
+        ]
+        
+        if timeout:
+            with _allergen_options_cache_lock:
+                _allergen_options_cache = options
+                _allergen_options_cache_at = time.monotonic()
+        
+        return list(options)
+    
+    @staticmethod
+    def get_allergen_name_map() -> Dict[int, str]:
+        """Known allergen names by ID, built from the cached checkbox options."""
+        return {option.id: option.name for option in AllergenService.get_allergen_options()}
+    
+    @staticmethod
+    def invalidate_allergen_options_cache() -> None:
+        """Drop the cached allergen options after allergens are added."""
+        global _allergen_options_cache
+        with _allergen_options_cache_lock:
+            _allergen_options_cache = None
+    
     @staticmethod
     def create_allergen(name: str) -> Allergen:
         """
@@ -37,6 +100,7 @@ class AllergenService:
         allergen = Allergen(name=name)
         db.session.add(allergen)
         db.session.commit()
+        AllergenService.invalidate_allergen_options_cache()
         
         logger.info(f"Created allergen: {name}")
         return allergen
@@ -49,7 +113,7 @@ class AllergenService:
         prefix: str
     ) -> None:
         """
-        Process allergens for a specific guest from form data.
+        Replace the allergens stored for a specific guest with those in form data.
         
         Args:
             rsvp_id: ID of the RSVP
@@ -61,20 +125,51 @@ class AllergenService:
             logger.warning(f"Cannot process allergens: rsvp_id is None for {guest_name}")
             return
         
-        logger.debug(f"Processing allergens for guest: {guest_name}, prefix: {prefix}, rsvp_id: {rsvp_id}")
-        
         # Delete existing allergens for this guest
-        existing_count = GuestAllergen.query.filter_by(
+        deleted = GuestAllergen.query.filter_by(
             rsvp_id=rsvp_id,
             guest_name=guest_name
-        ).count()
+        ).delete(synchronize_session=False)
+        if deleted:
+            logger.debug("Deleted %s existing allergens for %s", deleted, guest_name)
         
-        if existing_count > 0:
-            logger.debug(f"Deleting {existing_count} existing allergens for {guest_name}")
-            GuestAllergen.query.filter_by(
-                rsvp_id=rsvp_id,
-                guest_name=guest_name
-            ).delete()
+        rows = AllergenService.build_guest_allergen_rows(
+            rsvp_id, guest_name, form_data, prefix
+        )
+        if rows:
+            db.session.execute(insert(GuestAllergen), rows)
+    
+    @staticmethod
+    def build_guest_allergen_rows(
+        rsvp_id: int,
+        guest_name: str,
+        form_data: Dict[str, Any],
+        prefix: str,
+        allergen_names: Optional[Dict[int, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build GuestAllergen rows for a specific guest from form data.
+        
+        Nothing is written; callers collect the rows for every guest and
+        insert them in one statement.
+        
+        Args:
+            rsvp_id: ID of the RSVP
+            guest_name: Name of the guest
+            form_data: Form data dictionary
+            prefix: Form field prefix (e.g., 'main', 'adult_1')
+            allergen_names: Known allergens by ID, used to drop unknown IDs;
+                defaults to get_allergen_options(). Pass it in when building
+                rows for several guests.
+            
+        Returns:
+            List of column dictionaries for insert(GuestAllergen)
+        """
+        # Debug lines use lazy %-formatting: this runs for every guest on each
+        # RSVP submission and debug logging is off in production
+        logger.debug("Processing allergens for guest: %s, prefix: %s, rsvp_id: %s", guest_name, prefix, rsvp_id)
+        
+        rows: List[Dict[str, Any]] = []
         
         # Process standard allergens
         allergen_field_name = f'allergens_{prefix}'
@@ -92,44 +187,84 @@ class AllergenService:
         else:
             allergen_ids = []
         
-        logger.debug(f"Found allergen IDs for {allergen_field_name}: {allergen_ids}")
+        logger.debug("Found allergen IDs for %s: %s", allergen_field_name, allergen_ids)
+        
+        if allergen_ids and allergen_names is None:
+            allergen_names = AllergenService.get_allergen_name_map()
         
-        allergens_added = 0
         for allergen_id in allergen_ids:
-            try:
-                allergen_id = int(allergen_id)
-                # Verify the allergen exists
-                allergen = Allergen.query.get(allergen_id)
-                if allergen:
-                    guest_allergen = GuestAllergen(
-                        rsvp_id=rsvp_id,
-                        guest_name=guest_name,
-                        allergen_id=allergen_id
-                    )
-                    db.session.add(guest_allergen)
-                    allergens_added += 1
-                    logger.debug(f"Added allergen {allergen.name} for {guest_name}")
-                else:
-                    logger.warning(f"Allergen with ID {allergen_id} not found")
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Invalid allergen ID for {guest_name}: {allergen_id}, {e}")
+            if not str(allergen_id).isdecimal():
+                logger.warning(f"Invalid allergen ID for {guest_name}: {allergen_id}")
+                continue
+            allergen_id = int(allergen_id)
+            # Verify the allergen exists
+            if allergen_id not in allergen_names:
+                logger.warning(f"Allergen with ID {allergen_id} not found")
+                continue
+            # Every row carries the same keys so they batch into one executemany
+            rows.append({
+                'rsvp_id': rsvp_id,
+                'guest_name': guest_name,
+                'allergen_id': allergen_id,
+                'custom_allergen': None,
+            })
+            logger.debug("Added allergen %s for %s", allergen_names[allergen_id], guest_name)
         
         # Process custom allergen
         custom_field_name = f'custom_allergen_{prefix}'
         custom_allergen = form_data.get(custom_field_name, '').strip()
-        logger.debug(f"Custom allergen for {custom_field_name}: '{custom_allergen}'")
+        logger.debug("Custom allergen for %s: '%s'", custom_field_name, custom_allergen)
         
         if custom_allergen:
-            guest_allergen = GuestAllergen(
-                rsvp_id=rsvp_id,
-                guest_name=guest_name,
-                custom_allergen=custom_allergen
-            )
-            db.session.add(guest_allergen)
-            allergens_added += 1
-            logger.debug(f"Added custom allergen '{custom_allergen}' for {guest_name}")
+            rows.append({
+                'rsvp_id': rsvp_id,
+                'guest_name': guest_name,
+                'allergen_id': None,
+                'custom_allergen': custom_allergen,
+            })
+            logger.debug("Added custom allergen '%s' for %s", custom_allergen, guest_name)
+        
+        logger.debug("Total allergens added for %s: %s", guest_name, len(rows))
+        return rows
+    
+    @staticmethod
+    def sync_rsvp_allergens(rsvp_id: int, rows: List[Dict[str, Any]]) -> None:
+        """
+        Make the RSVP's stored allergens match rows.
+        
+        Rows already stored (same guest, allergen and custom text) are left
+        alone, so re-saving an unchanged RSVP writes nothing; stale rows are
+        removed with one DELETE and new ones added with one INSERT.
+        
+        Args:
+            rsvp_id: ID of the RSVP
+            rows: Column dictionaries from build_guest_allergen_rows
+        """
+        existing: Dict[tuple, List[int]] = {}
+        stored = db.session.query(
+            GuestAllergen.id,
+            GuestAllergen.guest_name,
+            GuestAllergen.allergen_id,
+            GuestAllergen.custom_allergen
+        ).filter(GuestAllergen.rsvp_id == rsvp_id)
+        for row_id, guest_name, allergen_id, custom_allergen in stored:
+            existing.setdefault((guest_name, allergen_id, custom_allergen), []).append(row_id)
         
-        logger.info(f"Total allergens added for {guest_name}: {allergens_added}")
+        new_rows = []
+        for row in rows:
+            matches = existing.get((row['guest_name'], row['allergen_id'], row['custom_allergen']))
+            if matches:
+                matches.pop()
+            else:
+                new_rows.append(row)
+        
+        stale_ids = [row_id for ids in existing.values() for row_id in ids]
+        if stale_ids:
+            GuestAllergen.query.filter(GuestAllergen.id.in_(stale_ids)).delete(
+                synchronize_session=False
+            )
+        if new_rows:
+            db.session.execute(insert(GuestAllergen), new_rows)
     
     @staticmethod
     def get_allergens_for_rsvp(rsvp_id: int) -> Dict[str, List[Dict[str, Any]]]:
@@ -143,7 +278,21 @@ class AllergenService:
             Dictionary with guest names as keys and list of allergen info as values
         """
         allergens = GuestAllergen.query.filter_by(rsvp_id=rsvp_id).all()
+        return AllergenService.group_allergens_by_guest(allergens)
+    
+    @staticmethod
+    def group_allergens_by_guest(
+        allergens: List[GuestAllergen]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Group already-loaded GuestAllergen rows by guest name.
         
+        Args:
+            allergens: GuestAllergen rows, e.g. an eager-loaded rsvp.allergens
+            
+        Returns:
+            Dictionary with guest names as keys and list of allergen info as values
+        """
         grouped = {}
         for allergen in allergens:
             if allergen.guest_name not in grouped:
@@ -1,16 +1,30 @@
 # app/services/guest_service.py
+import copy
+import itertools
 import secrets
 import logging
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from typing import List, Optional, Dict, Any, BinaryIO
+from flask import current_app
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager
 from app import db
 from app.models.guest import Guest
 from app.models.rsvp import RSVP
-from app.utils.import_guests import process_guest_csv
-from app.constants import (GuestLimit, Language, LogMessage, ErrorMessage)
+from app.models.allergen import GuestAllergen
+from app.utils.import_guests import process_guest_csv, iter_guest_csv_rows
+from app.constants import (GuestLimit, Language, LogMessage, ErrorMessage, TimeLimit, FileUpload)
 
 logger = logging.getLogger(__name__)
 
+# Cached result of get_guest_statistics(); dropped whenever the services write
+# guests or RSVPs, and otherwise refreshed after STATS_CACHE_TIMEOUT seconds
+_statistics_cache: Optional[Dict[str, Any]] = None
+_statistics_cache_at = 0.0
+_statistics_cache_lock = threading.Lock()
+
 
 class GuestService:
     """Service class for handling guest-related business logic."""
@@ -61,6 +75,7 @@ class GuestService:
         try:
             db.session.add(guest)
             db.session.commit()
+            GuestService.invalidate_statistics_cache()
             logger.info(LogMessage.GUEST_CREATED.format(name=guest.name, id=guest.id))
             return guest
         except IntegrityError as e:
@@ -81,6 +96,31 @@ class GuestService:
         """
         return Guest.query.filter_by(token=token).first()
     
+    @staticmethod
+    def get_guest_with_rsvp_by_token(token: str, rsvp_details: bool = False) -> Optional[Guest]:
+        """
+        Retrieve a guest by token with guest.rsvp loaded by the same query.
+        
+        Args:
+            token: The guest's unique token
+            rsvp_details: Also load the RSVP's plus-ones and allergen names,
+                for the RSVP form and summary pages that list them all
+            
+        Returns:
+            Guest or None if not found
+        """
+        options = [contains_eager(Guest.rsvp)]
+        if rsvp_details:
+            options += [
+                contains_eager(Guest.rsvp).selectinload(RSVP.additional_guests),
+                contains_eager(Guest.rsvp).joinedload(RSVP.allergens).joinedload(GuestAllergen.allergen),
+            ]
+        return (Guest.query
+                .outerjoin(Guest.rsvp)
+                .options(*options)
+                .filter(Guest.token == token)
+                .first())
+    
     @staticmethod
     def get_guest_by_id(guest_id: int) -> Optional[Guest]:
         """
@@ -129,6 +169,39 @@ class GuestService:
     
     @staticmethod
     def get_guest_statistics() -> Dict[str, Any]:
+        """
+        Get statistics about guests and RSVPs, cached for a short time.
+        
+        Returns:
+            Dictionary containing guest statistics
+        """
+        global _statistics_cache, _statistics_cache_at
+        
+        timeout = current_app.config.get('STATS_CACHE_TIMEOUT', TimeLimit.STATS_CACHE_TIMEOUT)
+        
+        with _statistics_cache_lock:
+            if (timeout and _statistics_cache is not None
+                    and time.monotonic() - _statistics_cache_at < timeout):
+                return copy.deepcopy(_statistics_cache)
+        
+        statistics = GuestService._compute_guest_statistics()
+        
+        if timeout:
+            with _statistics_cache_lock:
+                _statistics_cache = copy.deepcopy(statistics)
+                _statistics_cache_at = time.monotonic()
+        
+        return statistics
+    
+    @staticmethod
+    def invalidate_statistics_cache() -> None:
+        """Drop cached statistics after guests or RSVPs change."""
+        global _statistics_cache
+        with _statistics_cache_lock:
+            _statistics_cache = None
+    
+    @staticmethod
+    def _compute_guest_statistics() -> Dict[str, Any]:
         """
         Calculate statistics about guests and RSVPs.
         
@@ -214,6 +287,7 @@ class GuestService:
             
             # Commit all at once
             db.session.commit()
+            GuestService.invalidate_statistics_cache()
             logger.info(f"Successfully imported {len(guests)} guests")
             
             return guests
@@ -222,6 +296,48 @@ class GuestService:
             logger.error(f"Failed to import guests: {str(e)}")
             raise
     
+    @staticmethod
+    def import_guests_from_stream(
+        stream: BinaryIO,
+        chunk_size: int = FileUpload.IMPORT_CHUNK_SIZE
+    ) -> int:
+        """
+        Import guests from an uploaded CSV stream without loading it whole.
+        
+        Rows are parsed incrementally and written with one multi-row INSERT
+        per chunk, all inside a single transaction.
+        
+        Args:
+            stream: Binary file-like object with the CSV content
+            chunk_size: Number of rows per INSERT statement
+            
+        Returns:
+            Number of guests imported
+            
+        Raises:
+            ValueError: If CSV format is invalid
+            IntegrityError: If duplicate guests found
+        """
+        rows = iter_guest_csv_rows(stream)
+        total = 0
+        try:
+            while True:
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    break
+                db.session.execute(insert(Guest), chunk)
+                total += len(chunk)
+            
+            db.session.commit()
+            GuestService.invalidate_statistics_cache()
+            logger.info(f"Successfully imported {total} guests")
+            
+            return total
+        except (ValueError, IntegrityError) as e:
+            db.session.rollback()
+            logger.error(f"Failed to import guests: {str(e)}")
+            raise
+    
     @staticmethod
     def update_guest(
         guest_id: int,
@@ -258,6 +374,7 @@ class GuestService:
         
         try:
             db.session.commit()
+            GuestService.invalidate_statistics_cache()
             logger.info(f"Updated guest: {guest.name} (ID: {guest.id})")
             return guest
         except IntegrityError as e:
@@ -284,6 +401,7 @@ class GuestService:
             # The cascade delete should handle RSVP removal
             db.session.delete(guest)
             db.session.commit()
+            GuestService.invalidate_statistics_cache()
             logger.info(f"Deleted guest: {guest.name} (ID: {guest_id})")
             return True
         except Exception as e:
@@ -7,7 +7,7 @@ Generates professional PDF reports for venue and transport coordination
 import io
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, BinaryIO
 from flask import current_app
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, letter
@@ -138,17 +138,41 @@ class PDFService:
         canvas_obj.restoreState()
     
     @staticmethod
-    def generate_dietary_pdf() -> bytes:
+    def _finish_pdf(buffer, stream: Optional[BinaryIO], label: str) -> Optional[bytes]:
+        """Return the built PDF bytes, or leave them in the caller's stream."""
+        if stream is not None:
+            # The caller owns the stream; don't read it back or close it
+            logger.info(f"Generated {label} into stream")
+            return None
+
+        pdf_data = buffer.getvalue()
+        buffer.close()
+
+        logger.info(f"Generated {label}: {len(pdf_data)} bytes")
+        return pdf_data
+
+    @staticmethod
+    def generate_dietary_pdf(
+        stream: Optional[BinaryIO] = None,
+        dietary_data: Optional[Dict[str, Any]] = None,
+        children_menu_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[bytes]:
         """
         Generate comprehensive dietary restrictions PDF for venue/caterer.
         
+        Args:
+            stream: Optional writable file-like object. When given, the PDF is
+                written straight into it instead of an in-memory buffer.
+            dietary_data: Precomputed AdminService.get_dietary_report() (optional)
+            children_menu_data: Precomputed get_children_menu_data() (optional)
+
         Returns:
-            PDF file as bytes
+            PDF file as bytes, or None when written to ``stream``
         """
         logger.info("Generating dietary restrictions PDF")
         
-        # Create PDF buffer
-        buffer = io.BytesIO()
+        # Create PDF buffer (or write into the caller's stream)
+        buffer = stream if stream is not None else io.BytesIO()
         
         # Create document
         doc = SimpleDocTemplate(
@@ -184,9 +208,11 @@ class PDFService:
         normal_style = styles['Normal']
         
         # Get dietary data
-        dietary_data = AdminService.get_dietary_report()
+        if dietary_data is None:
+            dietary_data = AdminService.get_dietary_report()
 
-        children_menu_data = PDFService._get_children_menu_data()
+        if children_menu_data is None:
+            children_menu_data = PDFService.get_children_menu_data()
 
         # Executive Summary
         elements.append(Paragraph("Executive Summary", heading_style))
@@ -435,35 +461,29 @@ class PDFService:
         
         doc.build(elements, onFirstPage=add_page_decorations, onLaterPages=add_page_decorations)
         
-        # Get PDF data
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        
-        logger.info(f"Generated dietary PDF: {len(pdf_data)} bytes")
-        return pdf_data
+        return PDFService._finish_pdf(buffer, stream, "dietary PDF")
     
     @staticmethod
-    def _get_children_menu_data() -> Dict[str, List[Dict[str, Any]]]:
+    def get_children_menu_data(attending_rsvps: Optional[List[Any]] = None) -> Dict[str, List[Dict[str, Any]]]:
         """
         Get children menu requirements for PDF report.
         
+        Args:
+            attending_rsvps: Attending RSVPs already loaded by the caller (optional)
+        
         Returns:
             Dictionary with 'with_menu' and 'no_menu' lists
         """
-        from app.models.rsvp import RSVP, AdditionalGuest
-        
         children_with_menu = []
         children_no_menu = []
         
         # Get all attending RSVPs
-        attending_rsvps = RSVP.query.filter_by(is_attending=True, is_cancelled=False).all()
+        if attending_rsvps is None:
+            attending_rsvps = RSVPService.get_attending_rsvps()
         
         for rsvp in attending_rsvps:
             # Get children for this RSVP
-            children = AdditionalGuest.query.filter_by(
-                rsvp_id=rsvp.id,
-                is_child=True
-            ).all()
+            children = [ag for ag in rsvp.additional_guests if ag.is_child]
             
             for child in children:
                 # Build parent name with surname
@@ -628,17 +648,25 @@ class PDFService:
 
 
     @staticmethod
-    def generate_transport_pdf() -> bytes:
+    def generate_transport_pdf(
+        stream: Optional[BinaryIO] = None,
+        transport_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[bytes]:
         """
         Generate comprehensive transport requirements PDF for bus coordination.
         
+        Args:
+            stream: Optional writable file-like object. When given, the PDF is
+                written straight into it instead of an in-memory buffer.
+            transport_data: Precomputed AdminService.get_transport_report() (optional)
+
         Returns:
-            PDF file as bytes
+            PDF file as bytes, or None when written to ``stream``
         """
         logger.info("Generating transport requirements PDF")
         
-        # Create PDF buffer
-        buffer = io.BytesIO()
+        # Create PDF buffer (or write into the caller's stream)
+        buffer = stream if stream is not None else io.BytesIO()
         
         # Create document
         doc = SimpleDocTemplate(
@@ -682,7 +710,8 @@ class PDFService:
         normal_style = styles['Normal']
         
         # Get transport data
-        transport_data = AdminService.get_transport_report()
+        if transport_data is None:
+            transport_data = AdminService.get_transport_report()
         
         # Executive Summary
         elements.append(Paragraph("Transport Summary", heading_style))
@@ -845,27 +874,26 @@ class PDFService:
         
         doc.build(elements, onFirstPage=add_page_decorations, onLaterPages=add_page_decorations)
         
-        # Get PDF data
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        
-        logger.info(f"Generated transport PDF: {len(pdf_data)} bytes")
-        return pdf_data
+        return PDFService._finish_pdf(buffer, stream, "transport PDF")
     
     @staticmethod
-    def generate_preboda_pdf() -> bytes:
+    def generate_preboda_pdf(stream: Optional[BinaryIO] = None) -> Optional[bytes]:
         """
         Generate pre-boda attendance report PDF for venue coordination.
         
+        Args:
+            stream: Optional writable file-like object. When given, the PDF is
+                written straight into it instead of an in-memory buffer.
+
         Returns:
-            PDF file as bytes
+            PDF file as bytes, or None when written to ``stream``
         """
         logger.info("Generating pre-boda attendance PDF")
         
         from app.constants import PrebodaConfig
         
-        # Create PDF buffer
-        buffer = io.BytesIO()
+        # Create PDF buffer (or write into the caller's stream)
+        buffer = stream if stream is not None else io.BytesIO()
         
         # Create document
         doc = SimpleDocTemplate(
@@ -1041,12 +1069,7 @@ class PDFService:
         
         doc.build(elements, onFirstPage=add_page_decorations, onLaterPages=add_page_decorations)
         
-        # Get PDF data
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        
-        logger.info(f"Generated pre-boda PDF: {len(pdf_data)} bytes")
-        return pdf_data
+        return PDFService._finish_pdf(buffer, stream, "pre-boda PDF")
 
     @staticmethod
     def generate_combined_pdf() -> bytes:
@@ -3,18 +3,32 @@ import logging
 from datetime import datetime, date
 from typing import Dict, Any, Optional, Tuple, List
 from flask import current_app
+from sqlalchemy import insert, update
 from app import db
 from app.models.guest import Guest
 from app.models.rsvp import RSVP, AdditionalGuest
 from app.models.allergen import GuestAllergen
 from app.services.allergen_service import AllergenService
+from app.services.guest_service import GuestService
 from app.constants import (
     DateFormat, LogMessage, DEFAULT_CONFIG
 )
+from app.utils.dates import parse_config_date
 
 logger = logging.getLogger(__name__)
 
 
+def _form_int(value: Any, default: int = 0) -> int:
+    """Parse an integer form field, falling back to default instead of raising."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        digits = value[1:] if value.startswith('-') else value
+        if digits.isdecimal():
+            return int(value)
+    return default
+
+
 class RSVPService:
     """Service class for handling RSVP-related business logic."""
     
@@ -31,7 +45,7 @@ class RSVPService:
             return False
         
         try:
-            rsvp_deadline = datetime.strptime(rsvp_deadline_str, DateFormat.DATABASE).date()
+            rsvp_deadline = parse_config_date(rsvp_deadline_str)
             today = date.today()
             return today > rsvp_deadline
         except (ValueError, TypeError):
@@ -46,7 +60,7 @@ class RSVPService:
             return "Not specified"
         
         try:
-            rsvp_deadline = datetime.strptime(rsvp_deadline_str, DateFormat.DATABASE).date()
+            rsvp_deadline = parse_config_date(rsvp_deadline_str)
             return rsvp_deadline.strftime(DateFormat.DISPLAY)
         except (ValueError, TypeError):
             return rsvp_deadline_str
@@ -115,7 +129,8 @@ class RSVPService:
             
             # Get or create RSVP
             rsvp = RSVP.query.filter_by(guest_id=guest.id).first()
-            if not rsvp:
+            is_new = rsvp is None
+            if is_new:
                 rsvp = RSVP(guest_id=guest.id)
                 db.session.add(rsvp)
                 db.session.flush()  # Get ID for new RSVP
@@ -124,58 +139,76 @@ class RSVPService:
                 if not rsvp.is_editable:
                     return False, "This RSVP can no longer be edited.", rsvp
             
-            # Update basic attendance
-            is_attending = form_data.get('is_attending') == 'yes'
-            rsvp.is_attending = is_attending
-            rsvp.is_cancelled = False          # ← clears the stale cancellation
-            rsvp.cancellation_date = None
+            # Nothing below reads back what it writes, so hold every change for
+            # the commit instead of autoflushing before each lookup
+            with db.session.no_autoflush:
+                # Update basic attendance
+                is_attending = form_data.get('is_attending') == 'yes'
+                rsvp.is_attending = is_attending
+                rsvp.is_cancelled = False          # ← clears the stale cancellation
+                rsvp.cancellation_date = None
             
-            # Process pre-boda attendance (only if guest is invited)
-            preboda_value = form_data.get('preboda_attending')
-            if preboda_value == 'yes':
-                rsvp.preboda_attending = True
-            elif preboda_value == 'no':
-                rsvp.preboda_attending = False
-            # If not provided, leave as None (not yet answered)
+                # Process pre-boda attendance (only if guest is invited)
+                preboda_value = form_data.get('preboda_attending')
+                if preboda_value == 'yes':
+                    rsvp.preboda_attending = True
+                elif preboda_value == 'no':
+                    rsvp.preboda_attending = False
+                # If not provided, leave as None (not yet answered)
             
-            # Clear existing data
-            if rsvp.id:
-                GuestAllergen.query.filter_by(rsvp_id=rsvp.id).delete()
-                AdditionalGuest.query.filter_by(rsvp_id=rsvp.id).delete()
+                # Family members and allergens are reconciled with the stored
+                # rows once the form has been read
+                guest_rows: List[Dict[str, Any]] = []
+                allergen_rows: List[Dict[str, Any]] = []
             
-            # Process attendance details
-            if is_attending:
-                # Hotel and transport
-                rsvp.hotel_name = form_data.get('hotel_name', '').strip() or None
-                rsvp.transport_to_reception = 'transport_to_reception' in form_data
-                rsvp.transport_to_hotel = 'transport_to_hotel' in form_data
+                # Process attendance details
+                if is_attending:
+                    # Hotel and transport
+                    rsvp.hotel_name = form_data.get('hotel_name', '').strip() or None
+                    rsvp.transport_to_reception = 'transport_to_reception' in form_data
+                    rsvp.transport_to_hotel = 'transport_to_hotel' in form_data
                 
-                # Process allergens for main guest
-                AllergenService.process_guest_allergens(
-                    rsvp.id, guest.name, form_data, 'main'
-                )
-                # Process family members
-                RSVPService._process_family_members(rsvp, form_data)
+                    # Collect the main guest's and family members' rows,
+                    # checking allergen IDs against one lookup of known allergens
+                    allergen_names = AllergenService.get_allergen_name_map()
+                    allergen_rows = AllergenService.build_guest_allergen_rows(
+                        rsvp.id, guest.name, form_data, 'main', allergen_names
+                    )
+                    guest_rows = RSVPService._process_family_members(
+                        rsvp, form_data, allergen_rows, allergen_names
+                    )
                 
-            else:
-                # Reset fields for non-attending
-                rsvp.hotel_name = None
-                rsvp.transport_to_reception = False
-                rsvp.transport_to_hotel = False
-                rsvp.adults_count = 0
-                rsvp.children_count = 0
+                else:
+                    # Reset fields for non-attending
+                    rsvp.hotel_name = None
+                    rsvp.transport_to_reception = False
+                    rsvp.transport_to_hotel = False
+                    rsvp.adults_count = 0
+                    rsvp.children_count = 0
+            
+                if is_new:
+                    # Nothing stored yet, so there is nothing to diff against
+                    if guest_rows:
+                        db.session.execute(insert(AdditionalGuest), guest_rows)
+                    if allergen_rows:
+                        db.session.execute(insert(GuestAllergen), allergen_rows)
+                else:
+                    RSVPService._sync_additional_guests(rsvp.id, guest_rows)
+                    AllergenService.sync_rsvp_allergens(rsvp.id, allergen_rows)
             
-            # Update timestamp
-            rsvp.last_updated = datetime.now()
+                # Update timestamp; filled in by the database within the same
+                # INSERT/UPDATE rather than read from the app server's clock
+                rsvp.last_updated = db.func.now()
             
             # Commit changes
             db.session.commit()
+            GuestService.invalidate_statistics_cache()
             
             message = "Your RSVP has been submitted successfully!"
             if not is_attending:
                 message = "Your response has been recorded."
             
-            logger.info(f"RSVP {'created' if not rsvp.id else 'updated'} for guest {guest.name}")
+            logger.info(f"RSVP {'created' if is_new else 'updated'} for guest {guest.name}")
             
             # Sync to Airtable (async-safe, won't fail the main flow)
             RSVPService._sync_to_airtable(guest)
@@ -188,30 +221,40 @@ class RSVPService:
             return False, f"Error submitting RSVP: {str(e)}", None
     
     @staticmethod
-    def _process_family_members(rsvp: RSVP, form_data: Dict[str, Any]) -> None:
-        """Process family member information from form data."""
-        try:
-            rsvp.adults_count = int(form_data.get('adults_count', 0))
-            rsvp.children_count = int(form_data.get('children_count', 0))
-        except (ValueError, TypeError):
-            rsvp.adults_count = 0
-            rsvp.children_count = 0
+    def _process_family_members(
+        rsvp: RSVP,
+        form_data: Dict[str, Any],
+        allergen_rows: List[Dict[str, Any]],
+        allergen_names: Dict[int, str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Process family member information from form data.
+        
+        Sets the adult/child counts on the RSVP, appends each member's
+        allergen rows to allergen_rows and returns the AdditionalGuest rows
+        for the caller to insert. allergen_names is passed through to
+        AllergenService.build_guest_allergen_rows.
+        """
+        rsvp.adults_count = _form_int(form_data.get('adults_count'))
+        rsvp.children_count = _form_int(form_data.get('children_count'))
+        
+        guest_rows: List[Dict[str, Any]] = []
         
         # Process adults
         for i in range(rsvp.adults_count):
             name = form_data.get(f'adult_name_{i}', '').strip()
             if name:
-                guest_obj = AdditionalGuest(
-                    rsvp_id=rsvp.id,
-                    name=name,
-                    is_child=False
-                )
-                db.session.add(guest_obj)
+                guest_rows.append({
+                    'rsvp_id': rsvp.id,
+                    'name': name,
+                    'is_child': False,
+                    'needs_menu': False,
+                })
                 
                 # Process allergens
-                AllergenService.process_guest_allergens(
-                    rsvp.id, name, form_data, f'adult_{i}'
-                )
+                allergen_rows.extend(AllergenService.build_guest_allergen_rows(
+                    rsvp.id, name, form_data, f'adult_{i}', allergen_names
+                ))
         
         # Process children
         for i in range(rsvp.children_count):
@@ -220,18 +263,50 @@ class RSVPService:
                 # Check if child needs a menu (checkbox: present in form_data = checked)
                 needs_menu = f'child_needs_menu_{i}' in form_data
                 
-                guest_obj = AdditionalGuest(
-                    rsvp_id=rsvp.id,
-                    name=name,
-                    is_child=True,
-                    needs_menu=needs_menu
-                )
-                db.session.add(guest_obj)
+                guest_rows.append({
+                    'rsvp_id': rsvp.id,
+                    'name': name,
+                    'is_child': True,
+                    'needs_menu': needs_menu,
+                })
                 
                 # Process allergens
-                AllergenService.process_guest_allergens(
-                    rsvp.id, name, form_data, f'child_{i}'
-                )
+                allergen_rows.extend(AllergenService.build_guest_allergen_rows(
+                    rsvp.id, name, form_data, f'child_{i}', allergen_names
+                ))
+        
+        return guest_rows
+
+    @staticmethod
+    def _sync_additional_guests(rsvp_id: int, guest_rows: List[Dict[str, Any]]) -> None:
+        """
+        Make the RSVP's family members match guest_rows.
+        
+        Members are matched by name: matches are updated in place (and only
+        written if something changed), unmatched existing rows are deleted
+        and the remaining form rows are inserted in one statement.
+        """
+        existing: Dict[str, List[AdditionalGuest]] = {}
+        for member in AdditionalGuest.query.filter_by(rsvp_id=rsvp_id).all():
+            existing.setdefault(member.name, []).append(member)
+        
+        new_rows = []
+        for row in guest_rows:
+            matches = existing.get(row['name'])
+            if matches:
+                member = matches.pop()
+                member.is_child = row['is_child']
+                member.needs_menu = row['needs_menu']
+            else:
+                new_rows.append(row)
+        
+        removed_ids = [member.id for members in existing.values() for member in members]
+        if removed_ids:
+            AdditionalGuest.query.filter(AdditionalGuest.id.in_(removed_ids)).delete(
+                synchronize_session=False
+            )
+        if new_rows:
+            db.session.execute(insert(AdditionalGuest), new_rows)
 
     @staticmethod
     def cancel_rsvp(guest: Guest) -> Tuple[bool, str]:
@@ -244,30 +319,26 @@ class RSVPService:
         Returns:
             Tuple of (success, message)
         """
-        rsvp = RSVP.query.filter_by(guest_id=guest.id).first()
-        if not rsvp:
-            return False, "No RSVP found to cancel."
-        
         # Check if deadline passed
         if RSVPService.is_rsvp_deadline_passed():
             return False, "The RSVP deadline has passed. Please contact the wedding administrators."
         
-        # Check if cancellation is allowed
-        if not rsvp.is_editable:
-            return False, "Cancellations are not possible at this time. Please contact the wedding administrators."
-        
-        # Perform cancellation
-        rsvp.is_cancelled = True
-        rsvp.is_attending = False
-        rsvp.cancellation_date = datetime.now()
-        
-        # Support for test compatibility
-        if hasattr(rsvp, 'cancelled_at'):
-            rsvp.cancelled_at = rsvp.cancellation_date
-        
         try:
-            db.session.commit()
+            # Cancel with a single UPDATE that also enforces editability; only
+            # look at the row to explain why when nothing was updated
+            result = db.session.execute(
+                update(RSVP)
+                .where(RSVP.guest_id == guest.id, RSVP.editable_before_deadline_clause())
+                .values(is_cancelled=True, is_attending=False, cancellation_date=datetime.now())
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount == 0:
+                if not RSVPService.get_rsvp_by_guest_id(guest.id):
+                    return False, "No RSVP found to cancel."
+                return False, "Cancellations are not possible at this time. Please contact the wedding administrators."
             
+            db.session.commit()
+            GuestService.invalidate_statistics_cache()
             
             logger.info(f"RSVP cancelled for guest {guest.name}")
             
@@ -319,9 +390,10 @@ class RSVPService:
         return RSVP.query.filter_by(is_attending=True, is_cancelled=False).all()
     
     @staticmethod
-    def get_transport_summary() -> Dict[str, int]:
+    def get_transport_summary(attending_rsvps: Optional[List[RSVP]] = None) -> Dict[str, int]:
         """Get summary of transport requirements."""
-        attending_rsvps = RSVPService.get_attending_rsvps()
+        if attending_rsvps is None:
+            attending_rsvps = RSVPService.get_attending_rsvps()
         
         summary = {
             'to_reception': 0,
@@ -14,8 +14,12 @@ from __future__ import annotations
 import os
 import re
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Tuple, Dict, Any, List, TYPE_CHECKING
+from functools import lru_cache
+from typing import Optional, Tuple, Dict, Any, List, Callable, Sequence, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 
@@ -35,6 +39,18 @@ class MessageType(str, Enum):
     REMINDER_4 = "reminder_4"  # 3 days (final)
 
 
+# Reminder number -> message type (unknown numbers fall back to the first reminder)
+REMINDER_MESSAGE_TYPES = {
+    1: MessageType.REMINDER_1,
+    2: MessageType.REMINDER_2,
+    3: MessageType.REMINDER_3,
+    4: MessageType.REMINDER_4,
+}
+
+_NON_DIGITS = re.compile(r'\D')
+_E164_PHONE = re.compile(r'^\+[1-9]\d{6,14}$')  # + followed by 7-15 digits
+
+
 @dataclass
 class MessageResult:
     """Result of a WhatsApp message send attempt."""
@@ -175,6 +191,11 @@ class WhatsAppService:
         },
     }
     
+    # Twilio responses worth retrying: rate limited or transient server errors
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    MAX_SEND_ATTEMPTS = 3
+    RETRY_BACKOFF_SECONDS = 1.0
+    
     def __init__(self):
         """Initialize WhatsApp service with Twilio credentials."""
         self.account_sid = os.environ.get('TWILIO_ACCOUNT_SID')
@@ -184,6 +205,11 @@ class WhatsAppService:
         # Base URL for RSVP links
         self.base_url = os.environ.get('BASE_URL', 'https://wedding.aznarroa.com')
         
+        # Minimum spacing between sends so bulk jobs stay under the provider's rate
+        self.min_send_interval = float(os.environ.get('WHATSAPP_MIN_SEND_INTERVAL', '0'))
+        self._last_send_at = 0.0
+        self._send_lock = threading.Lock()
+        
         self._client = None
     
     @property
@@ -218,6 +244,7 @@ class WhatsAppService:
     # =========================================================================
     
     @classmethod
+    @lru_cache(maxsize=2048)
     def normalize_phone(
         cls, 
         phone: str, 
@@ -226,6 +253,9 @@ class WhatsAppService:
         """
         Normalize phone number to E.164 format for WhatsApp.
         
+        Memoised per input, since bulk sends normalise the same guests'
+        numbers again for every reminder; invalid numbers are not cached.
+        
         Args:
             phone: Phone number in various formats
             default_country_code: Country code to use if not present (default: +34)
@@ -249,7 +279,7 @@ class WhatsAppService:
         has_plus = phone.startswith('+')
         
         # Remove all non-digits
-        digits_only = re.sub(r'\D', '', phone)
+        digits_only = _NON_DIGITS.sub('', phone)
         
         if not digits_only:
             raise PhoneNumberError(f"No digits found in phone number: {original}")
@@ -292,9 +322,7 @@ class WhatsAppService:
         Returns:
             True if valid
         """
-        # E.164 format: + followed by 7-15 digits
-        pattern = r'^\+[1-9]\d{6,14}$'
-        return bool(re.match(pattern, phone))
+        return bool(_E164_PHONE.match(phone))
     
     @classmethod
     def format_for_whatsapp(cls, phone: str) -> str:
@@ -362,6 +390,18 @@ class WhatsAppService:
     # MESSAGE SENDING
     # =========================================================================
     
+    @classmethod
+    @lru_cache(maxsize=16)
+    def _get_template(cls, message_type: MessageType, lang: str) -> str:
+        """
+        Resolve the message template for a type and language, once per pair.
+        
+        Falls back to English when there is no template for ``lang``. Bulk
+        sends only substitute the guest's name and link per message.
+        """
+        templates = cls.TEMPLATES[message_type]
+        return templates.get(lang, templates['en'])
+    
     def send_message(
         self,
         to_phone: str,
@@ -384,7 +424,7 @@ class WhatsAppService:
             whatsapp_from = f"whatsapp:{self.whatsapp_number}"
             
             # Send via Twilio
-            twilio_message = self.client.messages.create(
+            twilio_message = self._create_with_retry(
                 body=message,
                 from_=whatsapp_from,
                 to=whatsapp_to
@@ -446,8 +486,7 @@ class WhatsAppService:
         
         rsvp_link = f"{self.base_url}/rsvp/{token}"
         
-        template = self.TEMPLATES[MessageType.RSVP_LINK].get(lang, 
-                self.TEMPLATES[MessageType.RSVP_LINK]['en'])
+        template = self._get_template(MessageType.RSVP_LINK, lang)
         
         message = template.format(name=name, rsvp_link=rsvp_link)
         
@@ -481,10 +520,9 @@ class WhatsAppService:
         
         rsvp_link = f"{self.base_url}/rsvp/{token}"
         
-        message_type = getattr(MessageType, f"REMINDER_{reminder_number}", MessageType.REMINDER_1)
+        message_type = REMINDER_MESSAGE_TYPES.get(reminder_number, MessageType.REMINDER_1)
         
-        template = self.TEMPLATES[message_type].get(lang,
-                   self.TEMPLATES[message_type]['en'])
+        template = self._get_template(message_type, lang)
         
         message = template.format(name=name, rsvp_link=rsvp_link)
         
@@ -492,6 +530,34 @@ class WhatsAppService:
         
         return self.send_message(phone, message)
     
+    def _wait_for_send_slot(self) -> None:
+        """Block until min_send_interval has passed since the previous send."""
+        if self.min_send_interval <= 0:
+            return
+        with self._send_lock:
+            wait = self._last_send_at + self.min_send_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_send_at = time.monotonic()
+    
+    def _create_with_retry(self, **kwargs):
+        """
+        Create a Twilio message, backing off exponentially on 429/5xx responses.
+        
+        Other errors, and the last failed attempt, are re-raised to send_message.
+        """
+        for attempt in range(self.MAX_SEND_ATTEMPTS):
+            self._wait_for_send_slot()
+            try:
+                return self.client.messages.create(**kwargs)
+            except Exception as e:
+                status = getattr(e, 'status', None)
+                if status not in self.RETRYABLE_STATUS_CODES or attempt == self.MAX_SEND_ATTEMPTS - 1:
+                    raise
+                delay = self.RETRY_BACKOFF_SECONDS * (2 ** attempt)
+                logger.warning(f"Twilio returned {status}, retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
     # =========================================================================
     # BULK OPERATIONS
     # =========================================================================
@@ -672,6 +738,32 @@ class WhatsAppService:
         return result
 
 
+def send_concurrently(
+    guests: Sequence[Any],
+    send_one: Callable[[Any], MessageResult],
+    max_workers: int
+) -> List[MessageResult]:
+    """
+    Call send_one for each guest on a bounded thread pool.
+    
+    Every send still goes through WhatsAppService._wait_for_send_slot(), so
+    WHATSAPP_MIN_SEND_INTERVAL caps the overall rate however many workers run.
+    
+    Args:
+        guests: Guests to send to
+        send_one: Function sending to one guest
+        max_workers: Maximum concurrent sends (1 sends serially)
+        
+    Returns:
+        MessageResults in the same order as guests
+    """
+    if max_workers <= 1 or len(guests) <= 1:
+        return [send_one(guest) for guest in guests]
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(guests))) as executor:
+        return list(executor.map(send_one, guests))
+
+
 # Singleton instance
 _whatsapp_service: Optional[WhatsAppService] = None
 
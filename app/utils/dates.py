@@ -0,0 +1,19 @@
+# app/utils/dates.py
+from datetime import date, datetime
+from functools import lru_cache
+
+from app.constants import DateFormat
+
+
+@lru_cache(maxsize=32)
+def parse_config_date(value: str) -> date:
+    """
+    Parse a YYYY-MM-DD date from config (RSVP_DEADLINE, WEDDING_DATE).
+
+    Memoised on the string itself, so hot paths such as RSVP.is_editable
+    skip strptime on every call but still follow config changes at runtime.
+
+    Raises:
+        ValueError/TypeError: If the value is not a valid date string
+    """
+    return datetime.strptime(value, DateFormat.DATABASE).date()
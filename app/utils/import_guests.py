@@ -1,40 +1,40 @@
 import csv
-from io import StringIO
+from io import BytesIO, TextIOWrapper
 import secrets
+from app.constants import FileUpload
 from app.models.guest import Guest
 
-def process_guest_csv(file_content):
-    """Process CSV file and return list of guest objects"""
+def iter_guest_csv_rows(stream):
+    """Yield guest column dicts from a binary CSV stream, one row at a time"""
     try:
-        content = file_content.decode('utf-8-sig')
-        stream = StringIO(content)
+        text = TextIOWrapper(stream, encoding=FileUpload.CSV_ENCODING, newline='')
         
-        reader = csv.DictReader(stream)
+        reader = csv.DictReader(text)
         required_headers = ['name', 'phone', 'language']
         
         if not all(header in reader.fieldnames for header in required_headers):
             missing = [h for h in required_headers if h not in reader.fieldnames]
             raise ValueError(f"Missing required headers: {', '.join(missing)}")
         
-        guests = []
         for row in reader:
             if not row['name'] or not row['phone']:
                 raise ValueError(f"Name and phone are required. Row data: {row}")
             
-            guest = Guest(
-                name=row['name'].strip(),
-                phone=row['phone'].strip(),
-                token=secrets.token_urlsafe(32),
-                language_preference=row.get('language', 'en').strip()
-            )
-            guests.append(guest)
-        
-        return guests
+            yield {
+                'name': row['name'].strip(),
+                'phone': row['phone'].strip(),
+                'token': secrets.token_urlsafe(32),
+                'language_preference': row.get('language', 'en').strip()
+            }
         
     except Exception as e:
         print(f"Error processing CSV: {str(e)}")
         raise ValueError(f"Error processing CSV: {str(e)}")
 
+def process_guest_csv(file_content):
+    """Process CSV file and return list of guest objects"""
+    return [Guest(**row) for row in iter_guest_csv_rows(BytesIO(file_content))]
+
 def validate_guest_data(row):
     """Validate guest data from CSV"""
     errors = []
@@ -0,0 +1,32 @@
+"""Add indexes to hot query paths
+
+Revision ID: 3f9d2c7a61e4
+Revises: b0724c4a094d
+Create Date: 2026-10-16 10:12:41.218304
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9d2c7a61e4'
+down_revision = 'b0724c4a094d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('guest', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_guest_phone'), ['phone'], unique=False)
+
+    with op.batch_alter_table('rsvp', schema=None) as batch_op:
+        batch_op.create_index('ix_rsvp_attending_cancelled', ['is_attending', 'is_cancelled'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('rsvp', schema=None) as batch_op:
+        batch_op.drop_index('ix_rsvp_attending_cancelled')
+
+    with op.batch_alter_table('guest', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_guest_phone'))
@@ -0,0 +1,32 @@
+"""Index RSVP foreign keys
+
+Revision ID: 7c1e5a9d4b20
+Revises: 3f9d2c7a61e4
+Create Date: 2026-10-16 15:40:07.512846
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c1e5a9d4b20'
+down_revision = '3f9d2c7a61e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('rsvp', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_rsvp_guest_id'), ['guest_id'], unique=False)
+
+    with op.batch_alter_table('additional_guest', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_additional_guest_rsvp_id'), ['rsvp_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('additional_guest', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_additional_guest_rsvp_id'))
+
+    with op.batch_alter_table('rsvp', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_rsvp_guest_id'))
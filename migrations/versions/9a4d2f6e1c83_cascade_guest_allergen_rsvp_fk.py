@@ -0,0 +1,28 @@
+"""Cascade RSVP deletes to guest allergens
+
+Revision ID: 9a4d2f6e1c83
+Revises: 7c1e5a9d4b20
+Create Date: 2026-10-16 17:05:22.904113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a4d2f6e1c83'
+down_revision = '7c1e5a9d4b20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('guest_allergen', schema=None) as batch_op:
+        batch_op.drop_constraint('guest_allergen_rsvp_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key('guest_allergen_rsvp_id_fkey', 'rsvp', ['rsvp_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade():
+    with op.batch_alter_table('guest_allergen', schema=None) as batch_op:
+        batch_op.drop_constraint('guest_allergen_rsvp_id_fkey', type_='foreignkey')
+        batch_op.create_foreign_key('guest_allergen_rsvp_id_fkey', 'rsvp', ['rsvp_id'], ['id'])
@@ -0,0 +1,26 @@
+"""Index guest allergens by RSVP and guest name
+
+Revision ID: b6e3c8a1f57d
+Revises: 9a4d2f6e1c83
+Create Date: 2026-10-16 18:12:41.337509
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e3c8a1f57d'
+down_revision = '9a4d2f6e1c83'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('guest_allergen', schema=None) as batch_op:
+        batch_op.create_index('ix_guest_allergen_rsvp_guest', ['rsvp_id', 'guest_name'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('guest_allergen', schema=None) as batch_op:
+        batch_op.drop_index('ix_guest_allergen_rsvp_guest')
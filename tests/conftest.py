@@ -7,6 +7,8 @@ from app.models.guest import Guest
 from app.models.rsvp import RSVP
 from app.models.allergen import Allergen
 from app.config import TestConfig
+from app.constants import Security
+from app.admin_auth import generate_admin_token
 from dotenv import load_dotenv
 from werkzeug.security import generate_password_hash
 
@@ -96,8 +98,10 @@ def auth_client(client, app):
     with client.session_transaction() as session:
         session['admin_logged_in'] = True
     
-    # Set the authentication cookie
-    client.set_cookie('admin_authenticated', 'true')
+    # Set the signed authentication cookie
+    with app.app_context():
+        token = generate_admin_token()
+    client.set_cookie(Security.ADMIN_COOKIE_NAME, token)
     return client
 
 @pytest.fixture
@@ -0,0 +1,222 @@
+# tests/test_airtable_jobs.py
+"""
+Tests for the Airtable admin routes that send WhatsApp messages.
+
+Tests cover:
+- Bulk sends are queued and return immediately with a redirect
+- Job status endpoint reports the summary once the thread finishes
+- The dashboard polls the job it was redirected back with
+- Unknown job ids return 404
+- A bulk send of the same kind can't be started twice at once
+- Single-guest sends look the guest up by record ID
+- Status polling answers If-None-Match with 304
+- API responses carry private Cache-Control and X-Cache headers
+- API responses answer If-None-Match with 304
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+from unittest.mock import Mock, patch
+
+from app.routes import admin_airtable
+
+
+def _wait_for_job(job_id, timeout=5.0):
+    """Wait for a bulk job thread to leave the running state."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with admin_airtable._bulk_jobs_lock:
+            job = admin_airtable._bulk_jobs.get(job_id)
+        if job and job['status'] != 'running':
+            return job
+        time.sleep(0.01)
+    pytest.fail(f"Job {job_id} did not finish in time")
+
+
+def _configured_services(guests):
+    airtable = Mock()
+    airtable.is_configured = True
+    airtable.get_guests_needing_link.return_value = guests
+    airtable.get_guests_needing_reminder.return_value = guests
+
+    whatsapp = Mock()
+    whatsapp.is_configured = True
+    whatsapp.send_rsvp_link_and_update_airtable.side_effect = [
+        Mock(success=True), Mock(success=False, error='Invalid number'),
+    ]
+    whatsapp.send_reminder_and_update_airtable.return_value = Mock(success=True)
+    return airtable, whatsapp
+
+
+class TestBulkJobs:
+    """Test bulk WhatsApp sends running as background jobs."""
+
+    @pytest.fixture(autouse=True)
+    def clear_jobs(self):
+        with admin_airtable._bulk_jobs_lock:
+            admin_airtable._bulk_jobs.clear()
+        yield
+
+    def test_send_all_links_runs_in_background(self, auth_client):
+        """Test that send-all-links redirects immediately and records the summary."""
+        guests = [Mock(name='a', token='t1'), Mock(name='b', token='t2')]
+        airtable, whatsapp = _configured_services(guests)
+
+        with patch.object(admin_airtable, 'get_services', return_value=(airtable, whatsapp)):
+            response = auth_client.post('/admin/airtable/send-all-links')
+
+            assert response.status_code == 302
+
+            with admin_airtable._bulk_jobs_lock:
+                job_id = next(jid for jid, job in admin_airtable._bulk_jobs.items()
+                              if job['kind'] == 'send-links')
+            job = _wait_for_job(job_id)
+
+        assert f'job={job_id}' in response.headers['Location']
+        assert job['status'] == 'done'
+        assert job['result'] == {'sent': 1, 'failed': 1}
+
+        status = auth_client.get(f'/admin/airtable/jobs/{job_id}')
+        assert status.status_code == 200
+        assert status.get_json()['result'] == {'sent': 1, 'failed': 1}
+
+    def test_batch_reminders_skip_guests_without_token(self, auth_client):
+        """Test that the reminder job counts guests without a token as failed."""
+        guests = [Mock(name='a', token='t1'), Mock(name='b', token=None)]
+        airtable, whatsapp = _configured_services(guests)
+
+        with patch.object(admin_airtable, 'get_services', return_value=(airtable, whatsapp)):
+            response = auth_client.post('/admin/airtable/send-reminders/2')
+            assert response.status_code == 302
+
+            with admin_airtable._bulk_jobs_lock:
+                job_id = next(jid for jid, job in admin_airtable._bulk_jobs.items()
+                              if job['kind'] == 'reminder-2')
+            job = _wait_for_job(job_id)
+
+        assert job['result'] == {'sent': 1, 'failed': 1}
+        whatsapp.send_reminder_and_update_airtable.assert_called_once()
+
+    def test_second_send_while_running_is_rejected(self, auth_client):
+        """Test that a bulk send isn't started twice while the first is running."""
+        guests = [Mock(name='a', token='t1')]
+        airtable, whatsapp = _configured_services(guests)
+        with admin_airtable._bulk_jobs_lock:
+            admin_airtable._bulk_jobs['running'] = {
+                'kind': 'reminder-2', 'status': 'running', 'result': None,
+                'error': None, 'created_at': datetime.utcnow(),
+            }
+
+        with patch.object(admin_airtable, 'get_services', return_value=(airtable, whatsapp)):
+            response = auth_client.post('/admin/airtable/send-reminders/2')
+
+        assert response.status_code == 302
+        with admin_airtable._bulk_jobs_lock:
+            assert list(admin_airtable._bulk_jobs) == ['running']
+        whatsapp.send_reminder_and_update_airtable.assert_not_called()
+
+    def test_dashboard_polls_job_from_redirect(self, auth_client):
+        """Test that the dashboard shows a status panel for the job it was sent back with."""
+        airtable = Mock(is_configured=False)
+        whatsapp = Mock(is_configured=False)
+
+        with patch.object(admin_airtable, 'get_services', return_value=(airtable, whatsapp)):
+            response = auth_client.get('/admin/airtable/?job=abc123')
+
+        assert response.status_code == 200
+        assert b'data-job-id="abc123"' in response.data
+
+    def test_unknown_job_returns_404(self, auth_client):
+        """Test polling an unknown job id."""
+        response = auth_client.get('/admin/airtable/jobs/does-not-exist')
+        assert response.status_code == 404
+
+
+class TestSingleGuestSends:
+    """Test sends that target one Airtable record."""
+
+    def test_single_reminder_fetches_one_record(self, auth_client):
+        """Test that a single reminder doesn't pull the whole guest table."""
+        airtable, whatsapp = _configured_services([])
+        guest = Mock(token='t1')
+        guest.name = 'Reminder Guest'
+        airtable.get_guest_by_record_id.return_value = guest
+
+        with patch.object(admin_airtable, 'get_services', return_value=(airtable, whatsapp)):
+            response = auth_client.post('/admin/airtable/send-reminder/rec123/1')
+
+        assert response.status_code == 302
+        airtable.get_guest_by_record_id.assert_called_once_with('rec123')
+        airtable.get_all_guests.assert_not_called()
+        whatsapp.send_reminder_and_update_airtable.assert_called_once_with(guest, airtable, 1)
+
+
+class TestStatusPolling:
+    """Test the JSON status endpoint polled by the dashboard."""
+
+    def test_status_returns_304_for_matching_etag(self, auth_client):
+        """Test that an unchanged status payload is answered with 304."""
+        airtable = Mock(is_configured=False, base_id=None)
+        whatsapp = Mock(is_configured=False, whatsapp_number=None, base_url='https://example.com')
+
+        with patch.object(admin_airtable, 'get_services', return_value=(airtable, whatsapp)):
+            response = auth_client.get('/admin/airtable/status')
+            etag = response.headers.get('ETag')
+            assert response.status_code == 200
+            assert etag
+
+            response = auth_client.get('/admin/airtable/status', headers={'If-None-Match': etag})
+            assert response.status_code == 304
+
+    def test_status_reports_cache_hit(self, auth_client):
+        """Test that the X-Cache header reflects the guest list cache."""
+        airtable = Mock(is_configured=True, base_id='appXXXXXXXXXXXX')
+        airtable.has_fresh_cache.return_value = True
+        airtable.get_all_guests_cached.return_value = []
+        whatsapp = Mock(is_configured=False, whatsapp_number=None, base_url='https://example.com')
+
+        with patch.object(admin_airtable, 'get_services', return_value=(airtable, whatsapp)):
+            response = auth_client.get('/admin/airtable/status')
+
+        assert response.headers['X-Cache'] == 'HIT'
+        assert response.get_json()['airtable']['guest_count'] == 0
+
+
+class TestApiCaching:
+    """Test the cache headers on the dashboard's JSON API."""
+
+    @pytest.mark.parametrize('path', ['/admin/airtable/api/guests', '/admin/airtable/api/stats'])
+    def test_api_responses_are_privately_cacheable(self, auth_client, path):
+        """Test that API responses can be reused briefly by the admin's browser."""
+        airtable = Mock(is_configured=True)
+        airtable.has_fresh_cache.return_value = False
+        airtable.get_all_guests_cached.return_value = []
+        airtable.get_statistics.return_value = {'total': 0}
+
+        with patch.object(admin_airtable, 'get_services', return_value=(airtable, Mock())):
+            response = auth_client.get(path)
+
+        assert response.status_code == 200
+        assert response.cache_control.private
+        assert response.cache_control.max_age == admin_airtable.API_MAX_AGE
+        assert response.headers['X-Cache'] == 'MISS'
+        airtable.get_all_guests_cached.assert_called_once()
+
+    def test_api_guests_returns_304_for_matching_etag(self, auth_client):
+        """Test that an unchanged guest list is answered with an empty 304."""
+        airtable = Mock(is_configured=True)
+        airtable.has_fresh_cache.return_value = True
+        airtable.get_all_guests_cached.return_value = []
+
+        with patch.object(admin_airtable, 'get_services', return_value=(airtable, Mock())):
+            response = auth_client.get('/admin/airtable/api/guests')
+            etag = response.headers.get('ETag')
+            assert etag
+
+            response = auth_client.get('/admin/airtable/api/guests',
+                                       headers={'If-None-Match': etag})
+
+        assert response.status_code == 304
+        assert response.data == b''
@@ -801,6 +801,95 @@ class TestAirtableServiceStatistics:
         assert stats['links_sent'] == 2
         assert stats['links_not_sent'] == 3  # Have token but no link_sent
 
+    def test_get_statistics_reuses_given_guests(self):
+        """Passing a pre-fetched guest list should skip the table fetch."""
+        service = AirtableService()
+
+        with patch.object(service, 'get_all_guests') as mock_get_all:
+            stats = service.get_statistics([])
+
+        mock_get_all.assert_not_called()
+        assert stats['total_guests'] == 0
+
+
+class TestAirtableGuestCache:
+    """Test the short-lived guest list cache used by admin views."""
+
+    def test_cached_list_reused_until_update(self):
+        """Cached reads should skip Airtable until the service writes a record."""
+        service = AirtableService()
+        service._table = Mock()
+        service._table.all.return_value = []
+
+        service.get_all_guests_cached()
+        service.get_all_guests_cached()
+        assert service._table.all.call_count == 1
+
+        service.update_link_sent('rec123')
+        service.get_all_guests_cached()
+        assert service._table.all.call_count == 2
+
+    def test_zero_max_age_always_refetches(self):
+        """A max_age of 0 should bypass the cache."""
+        service = AirtableService()
+        service._table = Mock()
+        service._table.all.return_value = []
+
+        service.get_all_guests_cached(max_age=0)
+        service.get_all_guests_cached(max_age=0)
+        assert service._table.all.call_count == 2
+
+    def test_has_fresh_cache_tracks_fetch_and_invalidation(self):
+        """has_fresh_cache should follow the cached list's lifecycle."""
+        service = AirtableService()
+        service._table = Mock()
+        service._table.all.return_value = []
+
+        assert not service.has_fresh_cache()
+        service.get_all_guests_cached()
+        assert service.has_fresh_cache()
+        service.invalidate_cache()
+        assert not service.has_fresh_cache()
+
+
+class TestGetGuestByRecordId:
+    """Test single-record lookups."""
+
+    def test_returns_guest_from_single_record_fetch(self):
+        """Lookup should hit the single-record endpoint, not the full table."""
+        service = AirtableService()
+        service._table = Mock()
+        service._table.get.return_value = {
+            'id': 'recSingle1',
+            'fields': {'Name': 'Single Guest', 'Token': 'tok-single'},
+        }
+
+        guest = service.get_guest_by_record_id('recSingle1')
+
+        assert guest.record_id == 'recSingle1'
+        assert guest.name == 'Single Guest'
+        service._table.get.assert_called_once_with('recSingle1')
+        service._table.all.assert_not_called()
+
+    def test_returns_none_for_unknown_record(self):
+        """A 404 from Airtable should map to None."""
+        service = AirtableService()
+        service._table = Mock()
+        error = Exception('Not found')
+        error.response = Mock(status_code=404)
+        service._table.get.side_effect = error
+
+        assert service.get_guest_by_record_id('recMissing') is None
+
+    def test_other_errors_propagate(self):
+        """Non-404 errors should be raised to the caller."""
+        service = AirtableService()
+        service._table = Mock()
+        service._table.get.side_effect = RuntimeError('boom')
+
+        with pytest.raises(RuntimeError):
+            service.get_guest_by_record_id('recBroken')
+
 
 class TestAirtableServiceSingleton:
     """Test singleton pattern for service access."""
@@ -4,6 +4,7 @@ from app import db
 from app.models.guest import Guest
 from app.models.rsvp import RSVP, AdditionalGuest
 from app.models.allergen import Allergen, GuestAllergen
+from app.admin_auth import generate_admin_token
 import secrets
 
 class TestAllergenFunctionality:
@@ -167,7 +168,7 @@ class TestAllergenFunctionality:
             db.session.commit()
             
             # Set authentication cookie for admin access
-            client.set_cookie('admin_authenticated', 'true')
+            client.set_cookie('admin_authenticated', generate_admin_token())
             
             # Access admin dashboard
             response = client.get('/admin/dashboard')
@@ -5,6 +5,7 @@ from app import create_app, db
 from app.models.guest import Guest
 from app.models.rsvp import RSVP
 from app.constants import HttpStatus, Security
+from app.admin_auth import generate_admin_token
 from app.services.guest_service import GuestService
 
 
@@ -26,7 +27,8 @@ class TestAdminAPIContracts:
     def auth_client(self, app):
         """Create authenticated client."""
         client = app.test_client()
-        client.set_cookie(Security.ADMIN_COOKIE_NAME, 'true')
+        with app.app_context():
+            client.set_cookie(Security.ADMIN_COOKIE_NAME, generate_admin_token())
         return client
     
     def test_admin_login_contract(self, app):
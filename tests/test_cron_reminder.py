@@ -7,6 +7,7 @@ Tests cover:
 - Endpoint authentication
 - Dry run mode
 - Reminder sending logic
+- Overlapping calls are rejected
 """
 
 import pytest
@@ -100,6 +101,44 @@ class TestReminderDateCalculations:
         assert result[3] == date(2026, 4, 29)  # 7 days before
         assert result[4] == date(2026, 5, 3)   # 3 days before
 
+    def test_calculate_reminder_dates_is_memoised(self):
+        """Test that reminder dates are computed once per deadline and read-only."""
+        from app.routes.cron import calculate_reminder_dates
+
+        deadline = date(2026, 5, 6)
+
+        result = calculate_reminder_dates(deadline)
+
+        assert calculate_reminder_dates(deadline) is result
+        with pytest.raises(TypeError):
+            result[1] = date(2026, 1, 1)
+
+
+class TestRunExclusively:
+    """Test that overlapping cron calls are rejected."""
+    
+    def test_overlapping_call_returns_409(self):
+        """A call made while the previous one is still running gets 409."""
+        from flask import Flask
+        from app.routes.cron import run_exclusively
+        
+        overlapping = []
+        
+        @run_exclusively
+        def endpoint():
+            if not overlapping:
+                # Simulate the scheduler retrying before the first call returns
+                overlapping.append(endpoint())
+            return 'done'
+        
+        with Flask(__name__).test_request_context('/api/cron/send-reminders'):
+            assert endpoint() == 'done'
+            _, status = overlapping[0]
+            assert status == 409
+            
+            # The lock is released once the first call finishes
+            assert endpoint() == 'done'
+
 
 class TestCronEndpointAuth:
     """Test cron endpoint authentication."""
@@ -413,6 +413,18 @@ class TestDataIntegrity:
             assert AdditionalGuest.query.filter_by(rsvp_id=rsvp.id).count() == 0
             assert GuestAllergen.query.filter_by(rsvp_id=rsvp.id).count() == 0
     
+    def test_sqlite_foreign_keys_only_on_app_engine(self, app):
+        """Test that foreign keys are enforced for the app's engine and no other."""
+        from sqlalchemy import create_engine, text
+        
+        with app.app_context():
+            assert db.session.execute(text('PRAGMA foreign_keys')).scalar() == 1
+        
+        other = create_engine('sqlite://')
+        with other.connect() as conn:
+            assert conn.execute(text('PRAGMA foreign_keys')).scalar() == 0
+        other.dispose()
+    
     # Add this fix to tests/test_edge_cases.py, TestDataIntegrity class
     def test_transaction_rollback(self, app):
         """Test that transactions rollback properly on error."""
@@ -1,5 +1,6 @@
 import pytest
 from flask import url_for
+from app.admin_auth import generate_admin_token
 import os
 
 class TestMainNavigation:
@@ -261,7 +262,8 @@ class TestAdminInterface:
         assert b'Admin Login' in response.data
 
         # Set cookie correctly for Flask 3.0+
-        client.set_cookie('admin_authenticated', 'true')
+        with app.app_context():
+            client.set_cookie('admin_authenticated', generate_admin_token())
         
         # Test accessing the dashboard
         response = client.get('/admin/dashboard')
@@ -270,7 +272,8 @@ class TestAdminInterface:
     def test_admin_add_guest(self, client, app):
         """Test adding a guest through the admin interface."""
         # Set authentication cookie
-        client.set_cookie('admin_authenticated', 'true')
+        with app.app_context():
+            client.set_cookie('admin_authenticated', generate_admin_token())
         
         # Test accessing the add guest page
         response = client.get('/admin/guest/add')
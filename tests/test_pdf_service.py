@@ -204,7 +204,18 @@ class TestPDFService:
             reader = PdfReader(pdf_buffer)
             
             assert len(reader.pages) > 0
-    
+
+    def test_transport_pdf_writes_into_stream(self, app, sample_data):
+        """Test that passing a stream writes the PDF into it instead of returning bytes."""
+        with app.app_context():
+            stream = io.BytesIO()
+            result = PDFService.generate_transport_pdf(stream)
+
+            assert result is None
+            stream.seek(0)
+            reader = PdfReader(stream)
+            assert len(reader.pages) > 0
+
     def test_transport_pdf_contains_guest_names(self, app, sample_data):
         """Test that transport PDF contains guest names."""
         with app.app_context():
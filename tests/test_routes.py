@@ -100,6 +100,35 @@ class TestMainRoutes:
             db.session.delete(guest)
             db.session.commit()
 
+    def test_health_check_reuses_recent_db_ping(self, client, monkeypatch):
+        """Test that back-to-back health checks share one database ping."""
+        from unittest.mock import patch
+        from app.routes import main
+
+        monkeypatch.setattr(main, '_db_healthy_at', None)
+
+        with patch.object(main.db.session, 'execute', wraps=main.db.session.execute) as execute:
+            first = client.get('/health')
+            second = client.get('/health')
+
+        assert first.status_code == 200
+        assert second.get_json() == {'status': 'healthy', 'database': 'connected'}
+        assert execute.call_count == 1
+
+    def test_health_check_does_not_cache_failures(self, client, monkeypatch):
+        """Test that a failed database ping is re-checked on the next probe."""
+        from unittest.mock import patch
+        from app.routes import main
+
+        monkeypatch.setattr(main, '_db_healthy_at', None)
+
+        with patch.object(main.db.session, 'execute', side_effect=Exception('db down')):
+            failed = client.get('/health')
+        recovered = client.get('/health')
+
+        assert failed.status_code == 503
+        assert recovered.status_code == 200
+
 class TestRSVPRoutes:
     def test_rsvp_form_with_valid_token(self, client, sample_guest):
         """Test the RSVP form with a valid token."""
@@ -310,6 +339,32 @@ class TestAdminAuthentication:
         assert response.status_code == 302
         assert '/admin/login' in response.location
     
+    def test_admin_dashboard_rejects_unsigned_cookie(self, client):
+        """Test that a forged admin cookie doesn't grant access."""
+        client.set_cookie('admin_authenticated', 'true')
+        response = client.get('/admin/dashboard', follow_redirects=False)
+        
+        assert response.status_code == 302
+        assert '/admin/login' in response.location
+    
+    def test_admin_dashboard_rejects_expired_cookie(self, client, app):
+        """Test that an admin token older than the session timeout is refused."""
+        from unittest.mock import patch
+        from app.admin_auth import generate_admin_token
+        from app.constants import TimeLimit
+        
+        with app.app_context():
+            with patch('itsdangerous.timed.TimestampSigner.get_timestamp',
+                       return_value=1_000_000 - TimeLimit.ADMIN_SESSION_TIMEOUT - 60):
+                token = generate_admin_token()
+        client.set_cookie('admin_authenticated', token)
+        
+        with patch('itsdangerous.timed.TimestampSigner.get_timestamp', return_value=1_000_000):
+            response = client.get('/admin/dashboard', follow_redirects=False)
+        
+        assert response.status_code == 302
+        assert '/admin/login' in response.location
+    
     def test_admin_dashboard_with_auth(self, auth_client):
         """Test accessing admin dashboard with authentication."""
         response = auth_client.get('/admin/dashboard')
@@ -378,6 +433,16 @@ class TestAdminGuestManagement:
         assert response.content_type.startswith('text/csv')
         assert b'name,phone,language' in response.data
     
+    def test_download_csv_template_conditional(self, auth_client):
+        """Test that a matching If-None-Match gets a 304 for the CSV template."""
+        response = auth_client.get('/admin/download-template')
+        etag = response.headers.get('ETag')
+        assert etag
+        
+        response = auth_client.get('/admin/download-template', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+    
     def test_import_guests_requires_auth(self, client):
         """Test that import guests requires authentication."""
         from io import BytesIO
@@ -46,6 +46,27 @@ class TestGuestService:
                 )
             assert "Please fill in all required fields" in str(excinfo.value)
     
+    def test_import_guests_from_stream_in_chunks(self, app):
+        """Test importing a CSV stream across several INSERT chunks."""
+        from io import BytesIO
+        csv_content = (b'name,phone,language\n'
+                       b'Stream Test 1,555-8101,en\n'
+                       b'Stream Test 2,555-8102,es\n'
+                       b'Stream Test 3,555-8103,en\n')
+        with app.app_context():
+            count = GuestService.import_guests_from_stream(BytesIO(csv_content), chunk_size=2)
+            
+            assert count == 3
+            imported = Guest.query.filter(Guest.phone.like('555-810%')).all()
+            assert len(imported) == 3
+            assert len({guest.token for guest in imported}) == 3
+            assert all(guest.created_at is not None for guest in imported)
+            
+            # Clean up
+            for guest in imported:
+                db.session.delete(guest)
+            db.session.commit()
+    
     def test_get_guest_by_token(self, app):
         """Test retrieving a guest by token."""
         with app.app_context():
@@ -122,6 +143,27 @@ class TestGuestService:
             db.session.delete(guest1)
             db.session.delete(guest2)
             db.session.commit()
+    
+    def test_guest_statistics_cached_until_write(self, app):
+        """Test that statistics are cached and dropped when a guest is created."""
+        with app.app_context():
+            app.config['STATS_CACHE_TIMEOUT'] = 60
+            GuestService.invalidate_statistics_cache()
+            try:
+                before = GuestService.get_guest_statistics()
+                
+                # Direct DB writes bypass the services, so the cache is served
+                guest = Guest(name='Cache Test Guest', phone='555-0003', token='cache-test')
+                db.session.add(guest)
+                db.session.commit()
+                assert GuestService.get_guest_statistics()['total_guests'] == before['total_guests']
+                
+                # Writes through the service invalidate it
+                GuestService.create_guest("Cache Test Guest 2", "555-0004")
+                assert GuestService.get_guest_statistics()['total_guests'] == before['total_guests'] + 2
+            finally:
+                app.config['STATS_CACHE_TIMEOUT'] = 0
+                GuestService.invalidate_statistics_cache()
 
 
 class TestRSVPService:
@@ -210,6 +252,33 @@ class TestRSVPService:
             db.session.delete(guest)
             db.session.commit()
     
+    def test_cancel_rsvp_outside_edit_window(self, app, monkeypatch):
+        """Test that an old RSVP cannot be cancelled once the wedding cutoff has passed."""
+        with app.app_context():
+            monkeypatch.setitem(app.config, 'RSVP_DEADLINE',
+                                (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d'))
+            monkeypatch.setitem(app.config, 'WEDDING_DATE',
+                                (datetime.now() + timedelta(days=3)).strftime('%Y-%m-%d'))
+            
+            guest = GuestService.create_guest("Late Cancel Guest", "555-LATECANCEL")
+            rsvp = RSVP(guest_id=guest.id, is_attending=True,
+                        created_at=datetime.now() - timedelta(days=2))
+            db.session.add(rsvp)
+            db.session.commit()
+            
+            success, message = RSVPService.cancel_rsvp(guest)
+            
+            assert success is False
+            assert "not possible" in message
+            db.session.refresh(rsvp)
+            assert rsvp.is_cancelled is False
+            assert rsvp.is_attending is True
+            
+            # Clean up
+            db.session.delete(rsvp)
+            db.session.delete(guest)
+            db.session.commit()
+    
     def test_is_rsvp_deadline_passed(self, app):
         """Test checking if RSVP deadline has passed."""
         with app.app_context():
@@ -426,6 +495,173 @@ class TestRSVPService:
             db.session.delete(guest)
             db.session.commit()
 
+    def test_family_rsvp_saves_each_members_allergens(self, app):
+        """Test that batched family rows keep each member's allergens apart."""
+        with app.app_context():
+            from app.models.rsvp import AdditionalGuest
+
+            # Ensure RSVP deadline is in the future
+            future_deadline = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+            app.config['RSVP_DEADLINE'] = future_deadline
+            
+            guest = GuestService.create_guest("Family Allergen Guest", "555-FAMALLERGEN")
+            allergen = Allergen.query.filter_by(name="Gluten").first()
+            if not allergen:
+                allergen = Allergen(name="Gluten")
+                db.session.add(allergen)
+                db.session.commit()
+            
+            form_data = {
+                'is_attending': 'yes',
+                'allergens_main': [str(allergen.id)],
+                'adults_count': '1',
+                'children_count': '1',
+                'adult_name_0': 'Family Adult',
+                'custom_allergen_adult_0': 'Kiwi',
+                'child_name_0': 'Family Child',
+                'allergens_child_0': [str(allergen.id)],
+                'custom_allergen_child_0': 'Egg',
+            }
+            
+            success, message, rsvp = RSVPService.create_or_update_rsvp(guest, form_data)
+            assert success is True, f"RSVP creation failed: {message}"
+            
+            members = AdditionalGuest.query.filter_by(rsvp_id=rsvp.id).all()
+            assert sorted((m.name, m.is_child) for m in members) == [
+                ('Family Adult', False), ('Family Child', True)
+            ]
+            
+            grouped = AllergenService.get_allergens_for_rsvp(rsvp.id)
+            assert len(grouped[guest.name]) == 1
+            assert len(grouped['Family Adult']) == 1
+            assert len(grouped['Family Child']) == 2
+            
+            # Clean up
+            GuestAllergen.query.filter_by(rsvp_id=rsvp.id).delete()
+            AdditionalGuest.query.filter_by(rsvp_id=rsvp.id).delete()
+            db.session.delete(rsvp)
+            db.session.delete(guest)
+            db.session.commit()
+
+    def test_update_rsvp_keeps_unchanged_family_rows(self, app):
+        """Test that resubmitting only rewrites family members that changed."""
+        with app.app_context():
+            from app.models.rsvp import AdditionalGuest
+
+            # Ensure RSVP deadline is in the future
+            future_deadline = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+            app.config['RSVP_DEADLINE'] = future_deadline
+            
+            guest = GuestService.create_guest("Family Diff Guest", "555-FAMDIFF")
+            form_data = {
+                'is_attending': 'yes',
+                'adults_count': '2',
+                'children_count': '0',
+                'adult_name_0': 'Kept Adult',
+                'adult_name_1': 'Dropped Adult',
+            }
+            success, message, rsvp = RSVPService.create_or_update_rsvp(guest, form_data)
+            assert success is True, f"RSVP creation failed: {message}"
+            kept_id = AdditionalGuest.query.filter_by(rsvp_id=rsvp.id, name='Kept Adult').one().id
+            
+            form_data.update({'adult_name_1': 'New Adult'})
+            success, message, rsvp = RSVPService.create_or_update_rsvp(guest, form_data)
+            assert success is True, f"RSVP update failed: {message}"
+            
+            members = {m.name: m.id for m in AdditionalGuest.query.filter_by(rsvp_id=rsvp.id)}
+            assert set(members) == {'Kept Adult', 'New Adult'}
+            assert members['Kept Adult'] == kept_id
+            
+            # Declining removes the family members
+            success, message, rsvp = RSVPService.create_or_update_rsvp(guest, {'is_attending': 'no'})
+            assert success is True, f"RSVP decline failed: {message}"
+            assert AdditionalGuest.query.filter_by(rsvp_id=rsvp.id).count() == 0
+            
+            # Clean up
+            db.session.delete(rsvp)
+            db.session.delete(guest)
+            db.session.commit()
+
+    def test_update_rsvp_only_rewrites_changed_allergens(self, app):
+        """Test that resubmitting keeps unchanged allergen rows and swaps changed ones."""
+        with app.app_context():
+            # Ensure RSVP deadline is in the future
+            future_deadline = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
+            app.config['RSVP_DEADLINE'] = future_deadline
+            
+            guest = GuestService.create_guest("Allergen Diff Guest", "555-ALLERGENDIFF")
+            allergen = Allergen.query.filter_by(name="Gluten").first()
+            if not allergen:
+                allergen = Allergen(name="Gluten")
+                db.session.add(allergen)
+                db.session.commit()
+            
+            form_data = {
+                'is_attending': 'yes',
+                'allergens_main': [str(allergen.id)],
+                'custom_allergen_main': 'Kiwi',
+            }
+            success, message, rsvp = RSVPService.create_or_update_rsvp(guest, form_data)
+            assert success is True, f"RSVP creation failed: {message}"
+            standard_id = GuestAllergen.query.filter_by(rsvp_id=rsvp.id, allergen_id=allergen.id).one().id
+            
+            form_data['custom_allergen_main'] = 'Mango'
+            success, message, rsvp = RSVPService.create_or_update_rsvp(guest, form_data)
+            assert success is True, f"RSVP update failed: {message}"
+            
+            rows = GuestAllergen.query.filter_by(rsvp_id=rsvp.id).all()
+            assert len(rows) == 2
+            assert standard_id in [r.id for r in rows]
+            assert [r.custom_allergen for r in rows if r.custom_allergen] == ['Mango']
+            
+            # Declining removes the allergens
+            success, message, rsvp = RSVPService.create_or_update_rsvp(guest, {'is_attending': 'no'})
+            assert success is True, f"RSVP decline failed: {message}"
+            assert GuestAllergen.query.filter_by(rsvp_id=rsvp.id).count() == 0
+            
+            # Clean up
+            db.session.delete(rsvp)
+            db.session.delete(guest)
+            db.session.commit()
+
+    def test_get_guest_with_rsvp_details_loads_related_rows(self, app):
+        """Test that the guest's RSVP comes with plus-ones and allergens loaded."""
+        from sqlalchemy import inspect
+        from app.models.rsvp import AdditionalGuest
+
+        with app.app_context():
+            guest = GuestService.create_guest("Display Test Guest", "555-DISPLAY")
+            allergen = Allergen.query.filter_by(name="Gluten").first()
+            rsvp = RSVP(guest_id=guest.id, is_attending=True)
+            db.session.add(rsvp)
+            db.session.flush()
+            db.session.add(AdditionalGuest(rsvp_id=rsvp.id, name="Display Plus One"))
+            db.session.add(GuestAllergen(rsvp_id=rsvp.id, guest_name=guest.name,
+                                         allergen_id=allergen.id))
+            db.session.commit()
+            guest_id = guest.id
+            db.session.expunge_all()
+
+            token = Guest.query.get(guest_id).token
+            db.session.expunge_all()
+
+            guest = GuestService.get_guest_with_rsvp_by_token(token, rsvp_details=True)
+            assert 'rsvp' not in inspect(guest).unloaded
+            rsvp = guest.rsvp
+
+            unloaded = inspect(rsvp).unloaded
+            assert 'additional_guests' not in unloaded
+            assert 'allergens' not in unloaded
+            assert 'allergen' not in inspect(rsvp.allergens[0]).unloaded
+            assert rsvp.allergens[0].allergen.name == "Gluten"
+
+            # Clean up
+            GuestAllergen.query.filter_by(rsvp_id=rsvp.id).delete()
+            AdditionalGuest.query.filter_by(rsvp_id=rsvp.id).delete()
+            db.session.delete(rsvp)
+            db.session.delete(Guest.query.get(guest_id))
+            db.session.commit()
+
 class TestAllergenService:
     """Test cases for AllergenService."""
     
@@ -447,7 +683,45 @@ class TestAllergenService:
             # Clean up
             db.session.delete(allergen)
             db.session.commit()
-    
+
+    def test_allergen_options_cached_until_write(self, app):
+        """Test that allergen options are cached and dropped when one is created."""
+        with app.app_context():
+            app.config['ALLERGEN_CACHE_TIMEOUT'] = 60
+            AllergenService.invalidate_allergen_options_cache()
+            try:
+                before = AllergenService.get_allergen_options()
+                assert 'Gluten' in [option.name for option in before]
+
+                # Direct DB writes bypass the service, so the cache is served
+                direct = Allergen(name='Test Direct Allergen')
+                db.session.add(direct)
+                db.session.commit()
+                assert AllergenService.get_allergen_options() == before
+
+                # Creating through the service invalidates it
+                created = AllergenService.create_allergen('Test Service Allergen')
+                names = [option.name for option in AllergenService.get_allergen_options()]
+                assert 'Test Direct Allergen' in names
+                assert 'Test Service Allergen' in names
+
+                db.session.delete(direct)
+                db.session.delete(created)
+                db.session.commit()
+            finally:
+                app.config['ALLERGEN_CACHE_TIMEOUT'] = 0
+                AllergenService.invalidate_allergen_options_cache()
+
+    def test_build_guest_allergen_rows_drops_unknown_ids(self, app):
+        """Test that malformed and unknown allergen IDs are skipped."""
+        with app.app_context():
+            gluten = Allergen.query.filter_by(name="Gluten").first()
+            form_data = {'allergens_main': ['abc', '-1', '999999', str(gluten.id)]}
+            
+            rows = AllergenService.build_guest_allergen_rows(1, 'Row Guest', form_data, 'main')
+            
+            assert [row['allergen_id'] for row in rows] == [gluten.id]
+
     def test_get_allergen_summary(self, app):
         """Test getting allergen summary."""
         with app.app_context():
@@ -563,4 +837,82 @@ class TestAdminService:
             db.session.delete(rsvp)
             db.session.delete(guest_with_rsvp)
             db.session.delete(guest_no_rsvp)
-            db.session.commit()
\ No newline at end of file
+            db.session.commit()
+
+    def test_detailed_rsvp_report_query_count(self, app):
+        """Test that the detailed report doesn't issue queries per RSVP."""
+        from sqlalchemy import event
+        from app.models.rsvp import AdditionalGuest
+        
+        with app.app_context():
+            allergen = Allergen.query.filter_by(name='Gluten').first()
+            for i in range(5):
+                guest = Guest(name=f'Report Test {i}', phone=f'555-RPT{i}', token=f'report-test-{i}')
+                db.session.add(guest)
+                db.session.flush()
+                rsvp = RSVP(guest_id=guest.id, is_attending=True)
+                db.session.add(rsvp)
+                db.session.flush()
+                db.session.add(AdditionalGuest(rsvp_id=rsvp.id, name=f'Plus One {i}'))
+                db.session.add(GuestAllergen(rsvp_id=rsvp.id, guest_name=guest.name,
+                                             allergen_id=allergen.id))
+            db.session.commit()
+            db.session.expire_all()
+            
+            statements = []
+            
+            def count_query(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+            
+            event.listen(db.engine, 'before_cursor_execute', count_query)
+            try:
+                report = AdminService.get_detailed_rsvp_report()
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', count_query)
+            
+            rows = [r for r in report if r['guest_name'].startswith('Report Test')]
+            assert len(rows) == 5
+            assert all(r['allergens'] == {r['guest_name']: [
+                {'type': 'standard', 'name': 'Gluten', 'id': allergen.id}
+            ]} for r in rows)
+            assert all(len(r['additional_guests']) == 1 for r in rows)
+            
+            # RSVPs+guests, plus-ones, allergens: independent of the RSVP count
+            assert len(statements) <= 4
+    
+    def test_export_reports_share_one_rsvp_scan(self, app):
+        """Test that transport and children menu data reuse preloaded RSVPs."""
+        from sqlalchemy import event
+        from app.models.rsvp import AdditionalGuest
+        from app.services.pdf_service import PDFService
+        
+        with app.app_context():
+            for i in range(3):
+                guest = Guest(name=f'Export Test {i}', phone=f'555-EXP{i}', token=f'export-test-{i}')
+                db.session.add(guest)
+                db.session.flush()
+                rsvp = RSVP(guest_id=guest.id, is_attending=True, transport_to_reception=True)
+                db.session.add(rsvp)
+                db.session.flush()
+                db.session.add(AdditionalGuest(rsvp_id=rsvp.id, name=f'Kid {i}', is_child=True))
+            db.session.commit()
+            db.session.expire_all()
+            
+            rsvps = AdminService.get_export_rsvps()
+            attending = [r for r in rsvps if r.is_attending and not r.is_cancelled]
+            
+            statements = []
+            
+            def count_query(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+            
+            event.listen(db.engine, 'before_cursor_execute', count_query)
+            try:
+                transport = AdminService.get_transport_report(attending)
+                children = PDFService.get_children_menu_data(attending)
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', count_query)
+            
+            assert statements == []
+            assert sum(1 for g in transport['to_reception'] if g['name'].startswith('Export Test')) == 3
+            assert sum(1 for c in children['no_menu'] if c['parent'].startswith('Export Test')) == 3
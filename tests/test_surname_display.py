@@ -16,6 +16,7 @@ from app.models.rsvp import RSVP, AdditionalGuest
 from app.models.allergen import Allergen, GuestAllergen
 from app.services.allergen_service import AllergenService
 from app.services.pdf_service import PDFService
+from app.admin_auth import generate_admin_token
 from PyPDF2 import PdfReader
 
 
@@ -320,7 +321,7 @@ class TestSurnameInPDFChildrenMenu:
             db.session.commit()
 
             # Get children menu data
-            children_data = PDFService._get_children_menu_data()
+            children_data = PDFService.get_children_menu_data()
 
             # Find our child in the with_menu list
             our_child = None
@@ -371,7 +372,7 @@ class TestSurnameInPDFChildrenMenu:
             db.session.commit()
 
             # Get children menu data
-            children_data = PDFService._get_children_menu_data()
+            children_data = PDFService.get_children_menu_data()
 
             # Find our child - should just be 'Pablo' without parentheses
             our_child = None
@@ -488,7 +489,7 @@ class TestSurnameInDashboard:
             db.session.commit()
 
             # Set admin cookie and access dashboard
-            client.set_cookie('admin_authenticated', 'true')
+            client.set_cookie('admin_authenticated', generate_admin_token())
             response = client.get('/admin/dashboard')
 
             assert response.status_code == 200
@@ -544,7 +545,7 @@ class TestSurnameInDashboard:
             db.session.commit()
 
             # Set admin cookie and access dietary report
-            client.set_cookie('admin_authenticated', 'true')
+            client.set_cookie('admin_authenticated', generate_admin_token())
             response = client.get('/admin/reports/dietary')
 
             assert response.status_code == 200
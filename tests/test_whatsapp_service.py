@@ -0,0 +1,105 @@
+# tests/test_whatsapp_service.py
+"""
+Tests for the WhatsApp messaging service.
+
+Tests cover:
+- Retrying rate-limited and transient Twilio errors with backoff
+- Giving up immediately on non-retryable errors
+- Concurrent bulk sends keep results in guest order
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from app.services import whatsapp_service
+from app.services.whatsapp_service import WhatsAppService, send_concurrently
+
+
+class TwilioError(Exception):
+    """Stand-in for TwilioRestException, which carries the HTTP status."""
+
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+@pytest.fixture
+def service():
+    service = WhatsAppService()
+    service.whatsapp_number = '+15550000000'
+    service._client = Mock()
+    return service
+
+
+class TestSendRetry:
+    """Test backoff around the Twilio messages API."""
+
+    def test_retries_rate_limited_send(self, service):
+        """Test that a 429 is retried with exponential backoff."""
+        service.client.messages.create.side_effect = [
+            TwilioError(429), TwilioError(503), Mock(sid='SM123'),
+        ]
+
+        with patch.object(whatsapp_service.time, 'sleep') as sleep:
+            result = service.send_message('+34600000000', 'Hola')
+
+        assert result.success
+        assert result.message_sid == 'SM123'
+        assert service.client.messages.create.call_count == 3
+        assert [call.args[0] for call in sleep.call_args_list] == [1.0, 2.0]
+
+    def test_gives_up_after_max_attempts(self, service):
+        """Test that persistent 429s end in a failed result."""
+        service.client.messages.create.side_effect = TwilioError(429)
+
+        with patch.object(whatsapp_service.time, 'sleep'):
+            result = service.send_message('+34600000000', 'Hola')
+
+        assert not result.success
+        assert service.client.messages.create.call_count == WhatsAppService.MAX_SEND_ATTEMPTS
+
+    def test_does_not_retry_client_errors(self, service):
+        """Test that a 400 fails without retrying."""
+        service.client.messages.create.side_effect = TwilioError(400)
+
+        with patch.object(whatsapp_service.time, 'sleep') as sleep:
+            result = service.send_message('+34600000000', 'Hola')
+
+        assert not result.success
+        assert service.client.messages.create.call_count == 1
+        sleep.assert_not_called()
+
+
+class TestSendConcurrently:
+    """Test the bounded thread pool used by bulk sends."""
+
+    def test_results_follow_guest_order(self):
+        """Test that results line up with guests whatever order sends finish in."""
+        def send_one(guest):
+            time.sleep(0.01 * (5 - guest))
+            return Mock(success=True, message_sid=f'SM{guest}')
+
+        results = send_concurrently(list(range(5)), send_one, max_workers=5)
+
+        assert [r.message_sid for r in results] == ['SM0', 'SM1', 'SM2', 'SM3', 'SM4']
+
+    def test_respects_max_workers(self):
+        """Test that no more than max_workers sends run at once."""
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        def send_one(guest):
+            with lock:
+                active.append(guest)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(guest)
+            return Mock(success=True)
+
+        send_concurrently(list(range(10)), send_one, max_workers=3)
+
+        assert max(peak) <= 3